@@ -1,7 +1,12 @@
 import asyncio
+import json
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 
 import discord
@@ -15,6 +20,27 @@ log = logging.getLogger("red.wzyss-cogs.applications")
 # Discord modals support at most 5 TextInput components per modal.
 MAX_FORM_FIELDS = 5
 
+# Accepted values for the field add/edit modal inputs.
+_VALID_FIELD_TYPES = frozenset({"text", "paragraph", "number", "confirm"})
+_REQUIRED_TRUE = frozenset({"true", "yes", "1", "required"})
+_REQUIRED_VALID = _REQUIRED_TRUE | frozenset({"false", "no", "0", "optional"})
+
+# Spaces become dashes in channel names built from display names.
+_SPACE_TO_DASH = str.maketrans(" ", "-")
+
+# Seconds to wait after the last form field edit before writing the form to Config.
+_FIELDS_FLUSH_DELAY = 0.5
+
+# Seconds a guild's embed color is reused before asking Red again (picks up [p]embedset changes).
+_EMBED_COLOR_TTL = 300
+
+# Interview channels deleted at once by cleanup; keeps a large backlog from bursting into 429s.
+_CLEANUP_CONCURRENCY = 5
+
+# Bounds (seconds) on how long the cleanup loop sleeps before its next due cleanup or tempban expiry.
+_CLEANUP_MIN_SLEEP = 60
+_CLEANUP_MAX_SLEEP = 3600
+
 # Custom ID prefixes for persistent buttons (must be stable across cog reloads).
 _LOBBY_APPLY_CUSTOM_ID = "applications:apply"
 _APPROVE_CUSTOM_ID_PREFIX = "applications:approve:"
@@ -22,103 +48,174 @@ _DENY_CUSTOM_ID_PREFIX = "applications:deny:"
 _INTERVIEW_CUSTOM_ID_PREFIX = "applications:interview:"
 
 
+class AppStatus(IntEnum):
+    """In-memory status codes; Config keeps the "status" strings for compatibility."""
+
+    PENDING = 0
+    APPROVED = 1
+    DENIED = 2
+
+
+_STATUS_BY_NAME = {status.name.lower(): status for status in AppStatus}
+
+
+class CompiledField(NamedTuple):
+    """A form field normalized once for modal construction (Discord limits already applied)."""
+
+    name: str
+    label: str  # Full prompt, used in validation messages
+    type: str
+    input_label: str  # Max 45 chars
+    placeholder: Optional[str]  # Max 100 chars
+    default: Optional[str]  # Max 4000 chars
+    required: bool
+    configured_placeholder: str  # As entered by the admin (placeholder may be a derived fallback)
+    style: discord.TextStyle
+    max_length: int
+    confirm_text: str
+    confirm_lower: str  # confirm_text.lower(), for case-insensitive matching
+
+
+# TextInput style and Discord max length per field type; anything else is a short text input
+_INPUT_STYLES: Dict[str, Tuple[discord.TextStyle, int]] = {
+    "paragraph": (discord.TextStyle.paragraph, 4000),
+    "number": (discord.TextStyle.short, 20),
+    "text": (discord.TextStyle.short, 4000),
+}
+
+
+def _compile_form(form_fields: List[Dict]) -> Tuple[CompiledField, ...]:
+    """Resolve labels, placeholders and input styles for each configured field."""
+    compiled = []
+    for field in form_fields:
+        field_type = field.get("type", "text")
+        label_full = field.get("label", field.get("name", "Field"))
+        placeholder = field.get("placeholder", "")
+        default = field.get("default", "")
+        confirm_text = field.get("confirm_text", "")
+
+        # Discord hard limit: TextInput label max 45 chars.
+        # If label was truncated and no explicit placeholder was provided, use the full label as placeholder.
+        # (Placeholder max is 100 chars; still better than losing the prompt entirely.)
+        if label_full and len(label_full) > 45 and not placeholder:
+            placeholder = label_full
+
+        # For confirm fields, build placeholder from required text
+        if field_type == "confirm":
+            if confirm_text and not placeholder:
+                placeholder = f"Type exactly: {confirm_text}"
+            elif not placeholder:
+                placeholder = "Type the required confirmation text"
+
+        style, max_length = _INPUT_STYLES.get(field_type, _INPUT_STYLES["text"])
+
+        compiled.append(
+            CompiledField(
+                name=field["name"],
+                label=label_full,
+                type=field_type,
+                input_label=label_full[:45],
+                placeholder=placeholder[:100] if placeholder else None,
+                default=default[:4000] if default else None,
+                required=field.get("required", True),
+                configured_placeholder=field.get("placeholder", ""),
+                style=style,
+                max_length=max_length,
+                confirm_text=confirm_text,
+                confirm_lower=confirm_text.lower(),
+            )
+        )
+    return tuple(compiled)
+
+
+def _parse_timestamp(value) -> Optional[float]:
+    """Parse a stored ISO time (naive UTC, e.g. cleanup_scheduled_at) to epoch seconds, or None if unusable."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+def _member_timestamps(member: discord.Member) -> Tuple[int, Optional[int]]:
+    """Unix timestamps for a member's account creation and server join (None if the join time is unknown)."""
+    joined_at = member.joined_at
+    return int(member.created_at.timestamp()), (int(joined_at.timestamp()) if joined_at else None)
+
+
+@lru_cache(maxsize=1024)
+def _format_user_block(user_id: int, display_name: str, created_ts: int, joined_ts: Optional[int]) -> str:
+    """The review embed's "User Information" text; cached since staff re-render the same applicants often."""
+    joined = f"<t:{joined_ts}:R>" if joined_ts is not None else "Unknown"
+    return (
+        f"**User:** <@{user_id}> ({display_name})\n"
+        f"**ID:** {user_id}\n"
+        f"**Account Created:** <t:{created_ts}:R>\n"
+        f"**Joined Server:** {joined}"
+    )
+
+
+def _role_mentions(roles: List[discord.Role], limit: int = 1024) -> str:
+    """Comma-joined role mentions for an embed field, or a role count once they would exceed the limit."""
+    length = -2
+    for role in roles:
+        length += len(role.mention) + 2
+        if length > limit:
+            return f"{len(roles)} roles"
+    return ", ".join(role.mention for role in roles)
+
+
 class ApplicationModal(Modal):
-    """Dynamic modal for application forms."""
+    """Dynamic modal for application forms. Use a per-guild subclass from _specialize_modal()."""
+
+    # Baked in per guild by _specialize_modal()
+    form: Tuple[CompiledField, ...] = ()
+    field_names: Tuple[str, ...] = ()
+    confirm_fields: Tuple[CompiledField, ...] = ()  # Confirm fields that have text to match
 
-    def __init__(self, cog: "Applications", form_fields: List[Dict], preview: bool = False):
+    def __init__(self, cog: "Applications", preview: bool = False):
         super().__init__(title="Server Application" + (" (Preview)" if preview else ""))
         self.cog = cog
-        self.form_fields = form_fields
         self.preview = preview
         self.inputs = {}
 
-        # Create text inputs for each field
-        for field in form_fields:
-            field_type = field.get("type", "text")
-            label_full = field.get("label", field.get("name", "Field"))
-            # Discord hard limit: TextInput label max 45 chars.
-            # Preserve longer prompts by moving the full prompt into the placeholder when possible.
-            label = label_full[:45]
-            placeholder = field.get("placeholder", "")
-            required = field.get("required", True)
-            default = field.get("default", "")
-
-            # If label was truncated and no explicit placeholder was provided, use the full label as placeholder.
-            # (Placeholder max is 100 chars; still better than losing the prompt entirely.)
-            if label_full and len(label_full) > 45 and not placeholder:
-                placeholder = label_full
-
-            # For confirm fields, build placeholder from required text
-            if field_type == "confirm":
-                confirm_text = field.get("confirm_text", "")
-                if confirm_text and not placeholder:
-                    placeholder = f"Type exactly: {confirm_text}"
-                elif not placeholder:
-                    placeholder = "Type the required confirmation text"
-
-            # Discord text input limits
-            if field_type == "paragraph":
-                text_input = TextInput(
-                    label=label,  # Max 45 chars
-                    placeholder=placeholder[:100] if placeholder else None,
-                    default=default[:4000] if default else None,
-                    required=required,
-                    style=discord.TextStyle.paragraph,
-                    max_length=4000,
-                )
-            elif field_type == "number":
-                text_input = TextInput(
-                    label=label,
-                    placeholder=placeholder[:100] if placeholder else None,
-                    default=default[:4000] if default else None,
-                    required=required,
-                    style=discord.TextStyle.short,
-                    max_length=20,
-                )
-            else:  # text (short)
-                text_input = TextInput(
-                    label=label,
-                    placeholder=placeholder[:100] if placeholder else None,
-                    default=default[:4000] if default else None,
-                    required=required,
-                    style=discord.TextStyle.short,
-                    max_length=4000,
-                )
-
-            self.inputs[field["name"]] = text_input
+        # Fields are pre-normalized by _compile_form, so this is a straight copy into TextInputs
+        for field in self.form:
+            text_input = TextInput(
+                label=field.input_label,
+                placeholder=field.placeholder,
+                default=field.default,
+                required=field.required,
+                style=field.style,
+                max_length=field.max_length,
+            )
+            self.inputs[field.name] = text_input
             self.add_item(text_input)
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle form submission."""
-        responses = {}
-        validation_errors = []
-
-        for field in self.form_fields:
-            field_name = field.get("name")
-            field_type = field.get("type", "text")
-            field_label = field.get("label", field_name)
-            text_input = self.inputs.get(field_name)
-
-            if not text_input:
-                continue
-
-            value = text_input.value.strip() if text_input.value else ""
-
-            # Validate confirm fields
-            if field_type == "confirm":
-                confirm_text = field.get("confirm_text", "")
-                if confirm_text:
-                    # Case-insensitive comparison for confirmation
-                    if value.lower() != confirm_text.lower():
-                        validation_errors.append(
-                            f"**{field_label}**: Must type exactly: `{confirm_text}`"
-                        )
-                        continue
-                    else:
-                        # Use the original confirmation text (preserve case)
-                        value = confirm_text
-
-            responses[field_name] = value
+        # Keys come pre-sized from the form; most submissions have no errors, so that list is lazy
+        responses = dict.fromkeys(self.field_names, "")
+        validation_errors: Optional[List[str]] = None
+
+        for field in self.form:
+            value = self.inputs[field.name].value
+            if value:
+                responses[field.name] = value.strip()
+
+        # Only confirm fields need checking; the subclass already knows which ones they are
+        for field in self.confirm_fields:
+            # Case-insensitive comparison for confirmation
+            if responses[field.name].lower() != field.confirm_lower:
+                if validation_errors is None:
+                    validation_errors = []
+                validation_errors.append(
+                    f"**{field.label}**: Must type exactly: `{field.confirm_text}`"
+                )
+            else:
+                # Use the original confirmation text (preserve case)
+                responses[field.name] = field.confirm_text
 
         # If validation errors, show them and don't submit
         if validation_errors:
@@ -160,6 +257,19 @@ class ApplicationModal(Modal):
         )
 
 
+def _specialize_modal(form: Tuple[CompiledField, ...]) -> type:
+    """Create an ApplicationModal subclass with one guild's compiled form baked in."""
+    return type(
+        "GuildApplicationModal",
+        (ApplicationModal,),
+        {
+            "form": form,
+            "field_names": tuple(f.name for f in form),
+            "confirm_fields": tuple(f for f in form if f.type == "confirm" and f.confirm_text),
+        },
+    )
+
+
 class ApplicationButton(Button):
     """Button to open the application form."""
 
@@ -177,17 +287,18 @@ class ApplicationButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         """Open the application modal."""
-        form_fields = await self.cog.config.guild(interaction.guild).form_fields()
-        if not form_fields:
+        guild = interaction.guild
+        modal_class = await self.cog.get_modal_class(guild)
+        if not modal_class.form:
             await interaction.response.send_message(
                 "❌ No application form has been configured. Please contact an administrator.",
                 ephemeral=True,
             )
             return
 
-        applications = await self.cog.config.guild(interaction.guild).applications()
-        existing = applications.get(str(interaction.user.id), {})
-        debug_bypass = await self.cog._is_debug_bypass_user(interaction.guild, interaction.user.id)
+        applications = await self.cog.get_applications(guild)
+        existing = applications.get(interaction.user.id, {})
+        debug_bypass = await self.cog._is_debug_bypass_user(guild, interaction.user.id)
         already_submitted = bool(
             isinstance(existing, dict)
             and (
@@ -203,7 +314,7 @@ class ApplicationButton(Button):
             )
             return
 
-        modal = ApplicationModal(self.cog, form_fields)
+        modal = modal_class(self.cog)
         await interaction.response.send_modal(modal)
 
 
@@ -238,15 +349,15 @@ class PreviewFormButton(Button):
 
     async def callback(self, interaction: discord.Interaction):
         """Open the application modal in preview mode."""
-        form_fields = await self.cog.config.guild(interaction.guild).form_fields()
-        if not form_fields:
+        modal_class = await self.cog.get_modal_class(interaction.guild)
+        if not modal_class.form:
             await interaction.response.send_message(
                 "No application form has been configured.",
                 ephemeral=True,
             )
             return
 
-        modal = ApplicationModal(self.cog, form_fields, preview=True)
+        modal = modal_class(self.cog, preview=True)
         await interaction.response.send_modal(modal)
 
 
@@ -281,238 +392,39 @@ class DenyModal(Modal):
         await self.cog.deny_application(interaction, self.member, reason)
 
 
-class ApproveButton(Button):
-    """Button to approve an application. Uses persistent custom_id so the view works after cog reload."""
-
-    def __init__(
-        self,
-        cog: "Applications",
-        member: Optional[discord.Member] = None,
-        user_id: Optional[int] = None,
-    ):
-        uid = (member.id if member else user_id) or 0
-        super().__init__(
-            label="Approve",
-            style=discord.ButtonStyle.success,
-            custom_id=f"{_APPROVE_CUSTOM_ID_PREFIX}{uid}",
-        )
-        self.cog = cog
-        self._member = member
-        self._user_id = user_id or (member.id if member else None)
-
-    async def callback(self, interaction: discord.Interaction):
-        """Approve the application."""
-        member = self._member or (
-            interaction.guild.get_member(self._user_id) if self._user_id else None
-        )
-        if not member:
-            await interaction.response.send_message(
-                "❌ Applicant is no longer in the server.", ephemeral=True
-            )
-            return
-        # Check permissions
-        if not await self.cog.can_manage_applications(interaction.user, interaction.guild):
-            await interaction.response.send_message(
-                "❌ You don't have permission to manage applications.", ephemeral=True
-            )
-            return
+class ApplicationReviewView(View):
+    """Approve/deny/interview buttons for one application, keyed only by the applicant's user ID.
 
-        # Check if already processed
-        applications = await self.cog.config.guild(interaction.guild).applications()
-        if str(member.id) not in applications:
-            await interaction.response.send_message(
-                f"❌ {member.mention} does not have an active application.", ephemeral=True
-            )
-            return
+    Only used to render the components when the review message is posted. Clicks are routed by
+    custom_id in Applications.on_interaction, so no view object is kept alive per application.
+    """
 
-        app_data = applications[str(member.id)]
-        if app_data.get("status") != "pending":
-            await interaction.response.send_message(
-                f"❌ This application is already {app_data.get('status')}.", ephemeral=True
+    def __init__(self, user_id: int):
+        super().__init__(timeout=None)
+        self.add_item(
+            Button(
+                label="Approve",
+                style=discord.ButtonStyle.success,
+                custom_id=f"{_APPROVE_CUSTOM_ID_PREFIX}{user_id}",
             )
-            return
-
-        # Approve the application
-        await self.cog.approve_application_interaction(interaction, member)
-
-
-class DenyButton(Button):
-    """Button to deny an application. Uses persistent custom_id so the view works after cog reload."""
-
-    def __init__(
-        self,
-        cog: "Applications",
-        member: Optional[discord.Member] = None,
-        user_id: Optional[int] = None,
-    ):
-        uid = (member.id if member else user_id) or 0
-        super().__init__(
-            label="Deny",
-            style=discord.ButtonStyle.danger,
-            custom_id=f"{_DENY_CUSTOM_ID_PREFIX}{uid}",
         )
-        self.cog = cog
-        self._member = member
-        self._user_id = user_id or (member.id if member else None)
-
-    async def callback(self, interaction: discord.Interaction):
-        """Open denial modal."""
-        member = self._member or (
-            interaction.guild.get_member(self._user_id) if self._user_id else None
-        )
-        if not member:
-            await interaction.response.send_message(
-                "❌ Applicant is no longer in the server.", ephemeral=True
-            )
-            return
-        # Check permissions
-        if not await self.cog.can_manage_applications(interaction.user, interaction.guild):
-            await interaction.response.send_message(
-                "❌ You don't have permission to manage applications.", ephemeral=True
-            )
-            return
-
-        # Check if already processed
-        applications = await self.cog.config.guild(interaction.guild).applications()
-        if str(member.id) not in applications:
-            await interaction.response.send_message(
-                f"❌ {member.mention} does not have an active application.", ephemeral=True
+        self.add_item(
+            Button(
+                label="Deny",
+                style=discord.ButtonStyle.danger,
+                custom_id=f"{_DENY_CUSTOM_ID_PREFIX}{user_id}",
             )
-            return
-
-        app_data = applications[str(member.id)]
-        if app_data.get("status") != "pending":
-            await interaction.response.send_message(
-                f"❌ This application is already {app_data.get('status')}.", ephemeral=True
-            )
-            return
-
-        # Open denial modal
-        modal = DenyModal(self.cog, member)
-        await interaction.response.send_modal(modal)
-
-
-class InterviewButton(Button):
-    """Button to open an interview channel for the applicant. Persistent custom_id for cog reloads."""
-
-    def __init__(
-        self,
-        cog: "Applications",
-        member: Optional[discord.Member] = None,
-        user_id: Optional[int] = None,
-    ):
-        uid = (member.id if member else user_id) or 0
-        super().__init__(
-            label="Interview",
-            style=discord.ButtonStyle.secondary,
-            emoji="💬",
-            custom_id=f"{_INTERVIEW_CUSTOM_ID_PREFIX}{uid}",
-        )
-        self.cog = cog
-        self._member = member
-        self._user_id = user_id or (member.id if member else None)
-
-    async def callback(self, interaction: discord.Interaction):
-        member = self._member or (
-            interaction.guild.get_member(self._user_id) if self._user_id else None
         )
-        if not member:
-            await interaction.response.send_message(
-                "❌ Applicant is no longer in the server.", ephemeral=True
-            )
-            return
-        if not await self.cog.can_manage_applications(interaction.user, interaction.guild):
-            await interaction.response.send_message(
-                "❌ You don't have permission to manage applications.", ephemeral=True
-            )
-            return
-        applications = await self.cog.config.guild(interaction.guild).applications()
-        if str(member.id) not in applications:
-            await interaction.response.send_message(
-                f"❌ No active application for {member.mention}.", ephemeral=True
-            )
-            return
-        app_data = applications[str(member.id)]
-        interview_channel_id = app_data.get("interview_channel_id")
-        if interview_channel_id:
-            ch = interaction.guild.get_channel(interview_channel_id)
-            if ch:
-                await interaction.response.send_message(
-                    f"Interview channel already exists: {ch.mention}",
-                    ephemeral=True,
-                )
-                return
-        # Create interview channel (use same category as review channel if possible)
-        guild = interaction.guild
-        review_channel_id = await self.cog.config.guild(guild).review_channel_id()
-        category = None
-        if review_channel_id:
-            ch = guild.get_channel(review_channel_id)
-            if ch and getattr(ch, "category", None):
-                category = ch.category
-        username = member.display_name.replace(" ", "-").lower()[:20]
-        channel_name = f"interview-{username}"
-        manager_role_ids = await self.cog.config.guild(guild).manager_roles()
-        manager_roles = [guild.get_role(rid) for rid in manager_role_ids if guild.get_role(rid)]
-        overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            member: discord.PermissionOverwrite(
-                view_channel=True, send_messages=True, read_message_history=True
-            ),
-        }
-        for role in manager_roles:
-            overwrites[role] = discord.PermissionOverwrite(
-                view_channel=True,
-                send_messages=True,
-                read_message_history=True,
-                manage_messages=True,
-            )
-        try:
-            new_channel = await guild.create_text_channel(
-                name=channel_name,
-                category=category,
-                overwrites=overwrites,
-                reason=f"Interview channel for {member.display_name}",
-            )
-        except (discord.Forbidden, discord.HTTPException) as e:
-            log.error("Failed to create interview channel: %s", e)
-            await interaction.response.send_message(
-                "❌ Could not create interview channel. Check bot permissions.",
-                ephemeral=True,
-            )
-            return
-        async with self.cog.config.guild(guild).applications() as apps:
-            if str(member.id) in apps:
-                apps[str(member.id)]["interview_channel_id"] = new_channel.id
-        try:
-            await new_channel.send(
-                f"{member.mention}, an interview has been requested by {interaction.user.mention}."
+        self.add_item(
+            Button(
+                label="Interview",
+                style=discord.ButtonStyle.secondary,
+                emoji="💬",
+                custom_id=f"{_INTERVIEW_CUSTOM_ID_PREFIX}{user_id}",
             )
-        except discord.HTTPException:
-            pass
-        await interaction.response.send_message(
-            f"✅ Interview channel created: {new_channel.mention}",
-            ephemeral=True,
         )
 
 
-class ApplicationReviewView(View):
-    """View with approve/deny/interview buttons for application review. Supports member or user_id for cog_load."""
-
-    def __init__(
-        self,
-        cog: "Applications",
-        member: Optional[discord.Member] = None,
-        user_id: Optional[int] = None,
-    ):
-        super().__init__(timeout=None)
-        self.cog = cog
-        uid = (member.id if member else user_id) or 0
-        self.add_item(ApproveButton(cog, member=member, user_id=uid if not member else None))
-        self.add_item(DenyButton(cog, member=member, user_id=uid if not member else None))
-        self.add_item(InterviewButton(cog, member=member, user_id=uid if not member else None))
-
-
 # --- Lobby embed builder (panel message in lobby channel) ---
 
 
@@ -641,7 +553,7 @@ class LobbyEmbedBuilderView(View):
         embed = discord.Embed(
             title="Lobby Panel Embed Builder",
             description="Use the buttons below to configure, preview, or save.",
-            color=await self.cog.bot.get_embed_color(guild),
+            color=await self.cog._embed_color(interaction.channel if interaction else self.message.channel),
         )
         embed.add_field(name="Title", value=(embed_data.get("title") or "Not set")[:1024], inline=False)
         embed.add_field(name="Description", value=(embed_data.get("description") or "Not set")[:1024], inline=False)
@@ -676,7 +588,7 @@ class LobbyEmbedBuilderView(View):
                 ephemeral=True,
             )
             return
-        embed = await self.cog._embed_from_lobby_data(interaction.guild, embed_data)
+        embed = await self.cog._embed_from_lobby_data(interaction.channel, embed_data)
         if not embed:
             await interaction.response.send_message(
                 "Configure at least a title for the embed.",
@@ -695,7 +607,7 @@ class LobbyEmbedBuilderView(View):
                 ephemeral=True,
             )
             return
-        await self.cog.config.guild(interaction.guild).lobby_embed.set(embed_data)
+        await self.cog._set_setting(interaction.guild, "lobby_embed", embed_data)
         self.cog._lobby_embed_builder_states.pop(interaction.user.id, None)
         await interaction.response.send_message(
             "Lobby embed saved. The panel in the lobby channel will use this when sent or refreshed.",
@@ -871,7 +783,7 @@ class SetupWizardView(View):
                     lines.append("• Log: (skip)")
                 manager_ids = s.get("manager_role_ids") or []
                 if manager_ids:
-                    roles = [guild.get_role(r) for r in manager_ids if guild.get_role(r)]
+                    roles = [role for r in manager_ids if (role := guild.get_role(r))]
                     lines.append("• Managers: " + ", ".join(r.mention for r in roles) if roles else "• Managers: (none)")
                 else:
                     lines.append("• Managers: (skip)")
@@ -958,7 +870,10 @@ class SetupWizardView(View):
             view_channel=True, send_messages=True, read_message_history=True,
             manage_messages=True, embed_links=True,
         )
-        manager_roles = [guild.get_role(rid) for rid in manager_ids if guild.get_role(rid)]
+        manager_roles = [role for rid in manager_ids if (role := guild.get_role(rid))]
+        manager_overwrite = discord.PermissionOverwrite(
+            view_channel=True, send_messages=True, read_message_history=True
+        )
 
         def overwrites_for_lobby():
             ow = {guild.me: bot_overwrite}
@@ -969,8 +884,7 @@ class SetupWizardView(View):
                 )
             else:
                 ow[guild.default_role] = discord.PermissionOverwrite(view_channel=True)
-            for r in manager_roles:
-                ow[r] = discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True)
+            ow.update(dict.fromkeys(manager_roles, manager_overwrite))
             return ow
 
         def overwrites_for_review_log():
@@ -980,8 +894,7 @@ class SetupWizardView(View):
             }
             if role_mode == "restricted" and pending_role:
                 ow[pending_role] = discord.PermissionOverwrite(view_channel=False)
-            for r in manager_roles:
-                ow[r] = discord.PermissionOverwrite(view_channel=True, send_messages=True, read_message_history=True)
+            ow.update(dict.fromkeys(manager_roles, manager_overwrite))
             return ow
 
         try:
@@ -997,31 +910,32 @@ class SetupWizardView(View):
         except (discord.Forbidden, discord.HTTPException) as e:
             await interaction.followup.send(f"Could not set channel permissions: {e}", ephemeral=True)
 
-        guild_config = self.cog.config.guild(guild)
-        await guild_config.lobby_channel_id.set(lobby_id)
-        await guild_config.review_channel_id.set(review_id)
-        await guild_config.log_channel.set(log_id if log_id else None)
-        await guild_config.role_mode.set(role_mode)
-        await guild_config.enabled.set(True)
-        await guild_config.manager_roles.set(manager_ids)
-        await guild_config.notification_role.set(notification_id if notification_id else None)
+        await self.cog._set_settings(guild, {
+            "lobby_channel_id": lobby_id,
+            "review_channel_id": review_id,
+            "log_channel": log_id if log_id else None,
+            "role_mode": role_mode,
+            "enabled": True,
+            "manager_roles": manager_ids,
+            "notification_role": notification_id if notification_id else None,
+        })
         if role_mode == "restricted" and pending_role:
-            await guild_config.restricted_role.set(pending_role.id)
+            await self.cog._set_setting(guild, "restricted_role", pending_role.id)
         elif role_mode == "access":
-            existing_access = await guild_config.access_roles()
+            existing_access = (await self.cog._get_settings(guild))["access_roles"]
             if not existing_access:
                 try:
                     member_role = await guild.create_role(
                         name="Member",
                         reason="Applications cog setup (access role)",
                     )
-                    await guild_config.access_roles.set([member_role.id])
+                    await self.cog._set_setting(guild, "access_roles", [member_role.id])
                 except (discord.Forbidden, discord.HTTPException):
                     pass
 
         msg = await self.cog.send_lobby_panel(lobby_ch)
         if msg:
-            await guild_config.lobby_panel_message_id.set(msg.id)
+            await self.cog._set_setting(guild, "lobby_panel_message_id", msg.id)
 
         summary = (
             f"**Setup complete ({role_mode} mode).**\n"
@@ -1278,12 +1192,50 @@ class SetupConfirmButton(Button):
         await self.wizard._finalize(interaction)
 
 
+def _parse_field_inputs(
+    name_value: str,
+    label_value: str,
+    type_value: str,
+    required_value: str,
+    extra_value: Optional[str],
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """Normalize and validate the field add/edit modal inputs. Returns (field_data, error_message)."""
+    field_type = type_value.strip().lower()
+    required_str = required_value.strip().lower()
+    # Extra is confirm_text for confirm type, placeholder for others (single input for Discord 5-input limit)
+    extra = extra_value.strip() if extra_value else ""
+
+    # Validate field type
+    if field_type not in _VALID_FIELD_TYPES:
+        return None, "❌ Invalid field type. Use `text`, `paragraph`, `number`, or `confirm`."
+
+    # Validate required
+    if required_str not in _REQUIRED_VALID:
+        return None, "❌ Invalid required value. Use `true` or `false`."
+
+    # Validate confirm fields
+    if field_type == "confirm" and not extra:
+        return None, "❌ Confirm fields require the exact text users must type."
+
+    field_data = {
+        "name": name_value.strip().lower(),
+        "label": label_value.strip(),
+        "type": field_type,
+        "required": required_str in _REQUIRED_TRUE,
+        "placeholder": extra[:100] if field_type != "confirm" else "",
+    }
+    if field_type == "confirm":
+        field_data["confirm_text"] = extra
+    return field_data, None
+
+
 class FieldAddModal(Modal):
     """Modal for adding a new form field."""
 
     def __init__(self, cog: "Applications"):
         super().__init__(title="Add Form Field")
         self.cog = cog
+        self.manager_view: Optional["FieldManagerView"] = None  # Set by the opener to refresh after submit
 
         self.name_input = TextInput(
             label="Field Name",
@@ -1325,41 +1277,22 @@ class FieldAddModal(Modal):
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle field creation."""
-        name = self.name_input.value.strip().lower()
-        label = self.label_input.value.strip()
-        field_type = self.type_input.value.strip().lower()
-        required_str = self.required_input.value.strip().lower()
-        extra = self.extra_input.value.strip() if self.extra_input.value else None
-        placeholder = (extra or "").strip()[:100] if field_type != "confirm" else ""
-
-        # Validate field type
-        if field_type not in ["text", "paragraph", "number", "confirm"]:
-            await interaction.response.send_message(
-                "❌ Invalid field type. Use `text`, `paragraph`, `number`, or `confirm`.",
-                ephemeral=True,
-            )
-            return
-
-        # Validate required
-        required = required_str in ["true", "yes", "1", "required"]
-        if required_str not in ["true", "yes", "1", "required", "false", "no", "0", "optional"]:
-            await interaction.response.send_message(
-                "❌ Invalid required value. Use `true` or `false`.",
-                ephemeral=True,
-            )
+        guild = interaction.guild
+        field_data, error = _parse_field_inputs(
+            self.name_input.value,
+            self.label_input.value,
+            self.type_input.value,
+            self.required_input.value,
+            self.extra_input.value,
+        )
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
-
-        # Validate confirm fields
-        if field_type == "confirm":
-            if not extra:
-                await interaction.response.send_message(
-                    "❌ Confirm fields require the exact text users must type.",
-                    ephemeral=True,
-                )
-                return
+        name = field_data["name"]
+        field_type = field_data["type"]
 
         # Add field
-        async with self.cog.config.guild(interaction.guild).form_fields() as fields:
+        async with self.cog._edit_form_fields(guild) as fields:
             if len(fields) >= MAX_FORM_FIELDS:
                 await interaction.response.send_message(
                     f"Forms may contain at most {MAX_FORM_FIELDS} fields (Discord limit).",
@@ -1367,35 +1300,27 @@ class FieldAddModal(Modal):
                 )
                 return
             # Check if field name already exists
-            if any(f.get("name") == name for f in fields):
+            if name in self.cog._fields_by_name[guild.id]:
                 await interaction.response.send_message(
                     f"❌ A field with name `{name}` already exists.",
                     ephemeral=True,
                 )
                 return
 
-            field_data = {
-                "name": name,
-                "label": label,
-                "type": field_type,
-                "required": required,
-                "placeholder": placeholder,
-            }
-
-            if field_type == "confirm":
-                field_data["confirm_text"] = extra.strip()
-
             fields.append(field_data)
 
-        confirm_text = f" requiring confirmation: `{extra}`" if field_type == "confirm" else ""
+        confirm_text = (
+            f" requiring confirmation: `{field_data['confirm_text']}`" if field_type == "confirm" else ""
+        )
         await interaction.response.send_message(
             f"✅ Added field `{name}` ({field_type}){confirm_text} to the application form.",
             ephemeral=True,
         )
 
         # Refresh the field manager view
-        if hasattr(self, "manager_view") and self.manager_view.message:
-            await self.manager_view.refresh()
+        manager_view = self.manager_view
+        if manager_view is not None and manager_view.message is not None:
+            await manager_view.refresh_after_modal()
 
 
 class FieldEditModal(Modal):
@@ -1404,6 +1329,7 @@ class FieldEditModal(Modal):
     def __init__(self, cog: "Applications", field: Dict):
         super().__init__(title="Edit Form Field")
         self.cog = cog
+        self.manager_view: Optional["FieldManagerView"] = None  # Set by the opener to refresh after submit
         self.field = field
         self.original_name = field.get("name")
 
@@ -1454,50 +1380,24 @@ class FieldEditModal(Modal):
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle field update."""
-        name = self.name_input.value.strip().lower()
-        label = self.label_input.value.strip()
-        field_type = self.type_input.value.strip().lower()
-        required_str = self.required_input.value.strip().lower()
-        extra = self.extra_input.value.strip() if self.extra_input.value else None
-        # Extra is confirm_text for confirm type, placeholder for others (single input for Discord 5-input limit)
-        placeholder = extra[:100] if field_type != "confirm" and extra else ""
-        if field_type == "confirm":
-            extra = extra or None
-
-        # Validate field type
-        if field_type not in ["text", "paragraph", "number", "confirm"]:
-            await interaction.response.send_message(
-                "❌ Invalid field type. Use `text`, `paragraph`, `number`, or `confirm`.",
-                ephemeral=True,
-            )
-            return
-
-        # Validate required
-        required = required_str in ["true", "yes", "1", "required"]
-        if required_str not in ["true", "yes", "1", "required", "false", "no", "0", "optional"]:
-            await interaction.response.send_message(
-                "❌ Invalid required value. Use `true` or `false`.",
-                ephemeral=True,
-            )
+        guild = interaction.guild
+        field_data, error = _parse_field_inputs(
+            self.name_input.value,
+            self.label_input.value,
+            self.type_input.value,
+            self.required_input.value,
+            self.extra_input.value,
+        )
+        if error:
+            await interaction.response.send_message(error, ephemeral=True)
             return
-
-        # Validate confirm fields
-        if field_type == "confirm":
-            if not extra:
-                await interaction.response.send_message(
-                    "❌ Confirm fields require the exact text users must type.",
-                    ephemeral=True,
-                )
-                return
+        name = field_data["name"]
+        field_type = field_data["type"]
 
         # Update field
-        async with self.cog.config.guild(interaction.guild).form_fields() as fields:
-            # Find the field to update
-            field_index = None
-            for i, f in enumerate(fields):
-                if f.get("name") == self.original_name:
-                    field_index = i
-                    break
+        async with self.cog._edit_form_fields(guild) as fields:
+            fields_by_name = self.cog._fields_by_name[guild.id]
+            field_index = fields_by_name.get(self.original_name)
 
             if field_index is None:
                 await interaction.response.send_message(
@@ -1507,81 +1407,59 @@ class FieldEditModal(Modal):
                 return
 
             # Check if renaming to an existing name (but not the same field)
-            if name != self.original_name and any(f.get("name") == name for f in fields):
+            if name != self.original_name and name in fields_by_name:
                 await interaction.response.send_message(
                     f"❌ A field with name `{name}` already exists.",
                     ephemeral=True,
                 )
                 return
 
-            # Build updated field (only allowed keys; drop legacy "options")
-            field_data = {
-                "name": name,
-                "label": label,
-                "type": field_type,
-                "required": required,
-                "placeholder": placeholder,
-            }
-            if field_type == "confirm":
-                field_data["confirm_text"] = extra.strip()
+            # Replace with the parsed field (only allowed keys; drops legacy "options")
             fields[field_index] = field_data
 
-        confirm_text = f" requiring confirmation: `{extra}`" if field_type == "confirm" else ""
+        confirm_text = (
+            f" requiring confirmation: `{field_data['confirm_text']}`" if field_type == "confirm" else ""
+        )
         await interaction.response.send_message(
             f"✅ Updated field `{name}` ({field_type}){confirm_text}.",
             ephemeral=True,
         )
 
         # Refresh the field manager view
-        if hasattr(self, "manager_view") and self.manager_view.message:
-            await self.manager_view.refresh()
+        manager_view = self.manager_view
+        if manager_view is not None and manager_view.message is not None:
+            await manager_view.refresh_after_modal()
 
 
 class FieldSelectMenu(Select):
     """Select menu for choosing a field to edit, delete, or move."""
 
-    def __init__(self, cog: "Applications", fields: List[Dict], action: str, manager_view: "FieldManagerView"):
+    def __init__(
+        self,
+        cog: "Applications",
+        options: List[discord.SelectOption],
+        action: str,
+        manager_view: "FieldManagerView",
+    ):
         self.cog = cog
         self.action = action  # "edit", "delete", "move_up", or "move_down"
         self.manager_view = manager_view
-        
-        options = []
-        for i, field in enumerate(fields):
-            field_type = field.get("type", "text")
-            label = field.get("label", field.get("name", "Unknown"))
-
-            options.append(
-                discord.SelectOption(
-                    label=f"{i+1}. {label[:80]}",
-                    description=f"Type: {field_type} | Name: {field.get('name')}",
-                    value=str(i),
-                    default=False,
-                )
-            )
-
-        if not options:
-            options.append(
-                discord.SelectOption(
-                    label="No fields available",
-                    description="Add a field first",
-                    value="-1",
-                )
-            )
 
         placeholder_text = f"Select a field to {action.replace('_', ' ')}..."
         super().__init__(
             placeholder=placeholder_text,
-            options=options[:25],  # Discord limit
+            options=list(options),  # Shared per form version; copy so this menu owns its list
         )
 
     async def callback(self, interaction: discord.Interaction):
         """Handle field selection."""
+        guild = interaction.guild
         if self.values[0] == "-1":
             await interaction.response.send_message("❌ No fields available.", ephemeral=True)
             return
 
         field_index = int(self.values[0])
-        fields = await self.cog.config.guild(interaction.guild).form_fields()
+        fields = await self.cog.get_form_fields(guild)
         
         if field_index >= len(fields):
             await interaction.response.send_message("❌ Field not found.", ephemeral=True)
@@ -1609,15 +1487,17 @@ class FieldSelectMenu(Select):
             cancel_button = Button(label="Cancel", style=discord.ButtonStyle.secondary)
 
             async def confirm_callback(interaction: discord.Interaction):
-                async with self.cog.config.guild(interaction.guild).form_fields() as fields_list:
-                    fields_list[:] = [f for f in fields_list if f.get("name") != field.get("name")]
+                async with self.cog._edit_form_fields(guild) as fields_list:
+                    field_index = self.cog._fields_by_name[guild.id].get(field.get("name"))
+                    if field_index is not None:
+                        del fields_list[field_index]
 
                 await interaction.response.send_message(
                     f"✅ Deleted field `{field.get('name')}`.",
                     ephemeral=True,
                 )
                 if self.manager_view.message:
-                    await self.manager_view.refresh()
+                    await self.manager_view.refresh_after_modal()
 
             async def cancel_callback(interaction: discord.Interaction):
                 await interaction.response.send_message("❌ Deletion cancelled.", ephemeral=True)
@@ -1633,7 +1513,7 @@ class FieldSelectMenu(Select):
                 await interaction.response.send_message("❌ Field is already at the top.", ephemeral=True)
                 return
 
-            async with self.cog.config.guild(interaction.guild).form_fields() as fields_list:
+            async with self.cog._edit_form_fields(guild) as fields_list:
                 fields_list[field_index], fields_list[field_index - 1] = (
                     fields_list[field_index - 1],
                     fields_list[field_index],
@@ -1644,13 +1524,13 @@ class FieldSelectMenu(Select):
                 ephemeral=True,
             )
             if self.manager_view.message:
-                await self.manager_view.refresh()
+                await self.manager_view.refresh_after_modal()
         elif self.action == "move_down":
             if field_index == len(fields) - 1:
                 await interaction.response.send_message("❌ Field is already at the bottom.", ephemeral=True)
                 return
 
-            async with self.cog.config.guild(interaction.guild).form_fields() as fields_list:
+            async with self.cog._edit_form_fields(guild) as fields_list:
                 fields_list[field_index], fields_list[field_index + 1] = (
                     fields_list[field_index + 1],
                     fields_list[field_index],
@@ -1661,7 +1541,7 @@ class FieldSelectMenu(Select):
                 ephemeral=True,
             )
             if self.manager_view.message:
-                await self.manager_view.refresh()
+                await self.manager_view.refresh_after_modal()
 
 
 class FieldManagerView(View):
@@ -1672,71 +1552,36 @@ class FieldManagerView(View):
         self.cog = cog
         self.message: Optional[discord.Message] = None
 
-    async def refresh(self, interaction: Optional[discord.Interaction] = None):
-        """Refresh the field list display."""
-        guild = None
-        if interaction:
-            guild = interaction.guild
-        elif self.message:
-            guild = self.message.guild
-        
-        if not guild:
-            return
-
-        fields = await self.cog.config.guild(guild).form_fields()
+    async def _render(self, channel: discord.abc.GuildChannel) -> discord.Embed:
+        """Build (or reuse) the field list embed for the channel's guild."""
+        return await self.cog._get_field_manager_embed(channel)
 
-        embed = discord.Embed(
-            title="📋 Application Form Fields Manager",
-            description="Use the buttons below to manage your application form fields. **Forms may contain at most 5 fields** (Discord limit).",
-            color=await self.cog.bot.get_embed_color(guild),
-        )
+    async def refresh_after_modal(self):
+        """Refresh the field list display when the triggering interaction was already answered."""
+        if not self.message:
+            return
+        embed = await self._render(self.message.channel)
+        try:
+            await self.message.edit(embed=embed, view=self)
+        except discord.NotFound:
+            # Message was deleted, can't refresh
+            pass
 
-        if not fields:
-            embed.add_field(
-                name="No Fields",
-                value="Add your first field using the **Add Field** button below.",
-                inline=False,
-            )
+    async def refresh_from_button(self, interaction: discord.Interaction):
+        """Refresh the field list display in response to a button on this view."""
+        if not self.cog._form_fields_cached(interaction.guild):
+            # First use reads Config; acknowledge now so a slow read can't expire the interaction
+            await interaction.response.defer()
+        embed = await self._render(interaction.channel)
+        if interaction.response.is_done():
+            await interaction.edit_original_response(embed=embed, view=self)
         else:
-            for i, field in enumerate(fields, 1):
-                field_type = field.get("type", "text")
-                required = field.get("required", True)
-                placeholder = field.get("placeholder", "")
-                confirm_text = field.get("confirm_text", "")
-
-                value_text = f"**Type:** {field_type}\n**Required:** {'Yes' if required else 'No'}"
-                if placeholder:
-                    value_text += f"\n**Placeholder:** {placeholder}"
-                if confirm_text:
-                    value_text += f"\n**Must type:** `{confirm_text}`"
-
-                embed.add_field(
-                    name=f"{i}. {field.get('label', field.get('name'))}",
-                    value=value_text,
-                    inline=False,
-                )
-
-        if interaction:
-            if interaction.response.is_done():
-                # Interaction already responded (e.g., from modal), edit the original message
-                if self.message:
-                    try:
-                        await self.message.edit(embed=embed, view=self)
-                    except discord.NotFound:
-                        pass
-            else:
-                await interaction.response.edit_message(embed=embed, view=self)
-        elif self.message:
-            try:
-                await self.message.edit(embed=embed, view=self)
-            except discord.NotFound:
-                # Message was deleted, can't refresh
-                pass
+            await interaction.response.edit_message(embed=embed, view=self)
 
     @discord.ui.button(label="Add Field", style=discord.ButtonStyle.success, emoji="➕")
     async def add_field(self, interaction: discord.Interaction, button: Button):
         """Open modal to add a new field."""
-        fields = await self.cog.config.guild(interaction.guild).form_fields()
+        fields = await self.cog.get_form_fields(interaction.guild)
         if len(fields) >= MAX_FORM_FIELDS:
             await interaction.response.send_message(
                 f"Forms may contain at most {MAX_FORM_FIELDS} fields (Discord limit). Delete a field to add another.",
@@ -1747,70 +1592,76 @@ class FieldManagerView(View):
         modal.manager_view = self
         await interaction.response.send_modal(modal)
 
-    @discord.ui.button(label="Edit Field", style=discord.ButtonStyle.primary, emoji="✏️")
-    async def edit_field(self, interaction: discord.Interaction, button: Button):
-        """Open select menu to choose a field to edit."""
-        fields = await self.cog.config.guild(interaction.guild).form_fields()
+    async def _open_field_selector(
+        self,
+        interaction: discord.Interaction,
+        action: str,
+        prompt: str,
+        empty_message: str,
+        min_count: int = 1,
+        too_few_message: Optional[str] = None,
+    ):
+        """Send an ephemeral field picker for one action, or an error if there are too few fields."""
+        guild = interaction.guild
+        if not self.cog._form_fields_cached(guild):
+            # First use reads Config; acknowledge now so a slow read can't expire the interaction
+            await interaction.response.defer(ephemeral=True)
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        fields = await self.cog.get_form_fields(guild)
         if not fields:
-            await interaction.response.send_message("❌ No fields to edit. Add a field first.", ephemeral=True)
+            await send(empty_message, ephemeral=True)
+            return
+        if len(fields) < min_count:
+            await send(too_few_message, ephemeral=True)
             return
 
         view = View(timeout=60)
-        select_menu = FieldSelectMenu(self.cog, fields, "edit", self)
-        view.add_item(select_menu)
-        await interaction.response.send_message("Select a field to edit:", view=view, ephemeral=True)
+        options = await self.cog._get_field_select_options(guild)
+        view.add_item(FieldSelectMenu(self.cog, options, action, self))
+        await send(prompt, view=view, ephemeral=True)
+
+    @discord.ui.button(label="Edit Field", style=discord.ButtonStyle.primary, emoji="✏️")
+    async def edit_field(self, interaction: discord.Interaction, button: Button):
+        """Open select menu to choose a field to edit."""
+        await self._open_field_selector(
+            interaction, "edit", "Select a field to edit:", "❌ No fields to edit. Add a field first."
+        )
 
     @discord.ui.button(label="Delete Field", style=discord.ButtonStyle.danger, emoji="🗑️")
     async def delete_field(self, interaction: discord.Interaction, button: Button):
         """Open select menu to choose a field to delete."""
-        fields = await self.cog.config.guild(interaction.guild).form_fields()
-        if not fields:
-            await interaction.response.send_message("❌ No fields to delete. Add a field first.", ephemeral=True)
-            return
-
-        view = View(timeout=60)
-        select_menu = FieldSelectMenu(self.cog, fields, "delete", self)
-        view.add_item(select_menu)
-        await interaction.response.send_message("Select a field to delete:", view=view, ephemeral=True)
+        await self._open_field_selector(
+            interaction, "delete", "Select a field to delete:", "❌ No fields to delete. Add a field first."
+        )
 
     @discord.ui.button(label="Move Up", style=discord.ButtonStyle.secondary, emoji="⬆️")
     async def move_up(self, interaction: discord.Interaction, button: Button):
         """Move selected field up in order."""
-        fields = await self.cog.config.guild(interaction.guild).form_fields()
-        if not fields:
-            await interaction.response.send_message("❌ No fields to reorder.", ephemeral=True)
-            return
-
-        if len(fields) < 2:
-            await interaction.response.send_message("❌ Need at least 2 fields to reorder.", ephemeral=True)
-            return
-
-        view = View(timeout=60)
-        select_menu = FieldSelectMenu(self.cog, fields, "move_up", self)
-        view.add_item(select_menu)
-        await interaction.response.send_message("Select a field to move up:", view=view, ephemeral=True)
+        await self._open_field_selector(
+            interaction,
+            "move_up",
+            "Select a field to move up:",
+            "❌ No fields to reorder.",
+            min_count=2,
+            too_few_message="❌ Need at least 2 fields to reorder.",
+        )
 
     @discord.ui.button(label="Move Down", style=discord.ButtonStyle.secondary, emoji="⬇️")
     async def move_down(self, interaction: discord.Interaction, button: Button):
         """Move selected field down in order."""
-        fields = await self.cog.config.guild(interaction.guild).form_fields()
-        if not fields:
-            await interaction.response.send_message("❌ No fields to reorder.", ephemeral=True)
-            return
-
-        if len(fields) < 2:
-            await interaction.response.send_message("❌ Need at least 2 fields to reorder.", ephemeral=True)
-            return
-
-        view = View(timeout=60)
-        select_menu = FieldSelectMenu(self.cog, fields, "move_down", self)
-        view.add_item(select_menu)
-        await interaction.response.send_message("Select a field to move down:", view=view, ephemeral=True)
+        await self._open_field_selector(
+            interaction,
+            "move_down",
+            "Select a field to move down:",
+            "❌ No fields to reorder.",
+            min_count=2,
+            too_few_message="❌ Need at least 2 fields to reorder.",
+        )
 
     @discord.ui.button(label="Refresh", style=discord.ButtonStyle.secondary, emoji="🔄")
     async def refresh_button(self, interaction: discord.Interaction, button: Button):
         """Refresh the field list."""
-        await self.refresh(interaction)
+        await self.refresh_from_button(interaction)
 
 
 class Applications(commands.Cog):
@@ -1870,16 +1721,60 @@ class Applications(commands.Cog):
 
         self.config.register_guild(**default_guild)
         self.cleanup_task: Optional[asyncio.Task] = None
+        self._cleanup_wakeup = asyncio.Event()  # Set when a cleanup or unban is scheduled, to re-plan the sleep
+        self._cleanup_deadline = 0.0  # Epoch seconds the cleanup loop is sleeping toward; 0 while not sleeping
+        self._lobby_view: Optional[LobbyPanelView] = None  # Built and registered once in cog_load
         self.timer_tasks: Dict[int, Dict[int, asyncio.Task]] = {}  # {guild_id: {user_id: task}}
         self._lobby_panel_locks: Dict[int, asyncio.Lock] = {}
+        self._lobby_panel_checks: Dict[int, asyncio.Task] = {}  # In-flight panel check shared by joining members
+        # Serializes approve/deny per application so two moderators cannot both resolve it
+        self._decision_locks: Dict[Tuple[int, int], asyncio.Lock] = {}
         self._lobby_embed_builder_states: Dict[int, Dict] = {}  # user_id -> {embed_data}
+        # Write-through caches of hot Config values (guild_id -> value); kept in sync by the _edit_* helpers
+        self._fields_cache: Dict[int, List[Dict]] = {}
+        self._fields_by_name: Dict[int, Dict[str, int]] = {}  # Index into _fields_cache, same guild key
+        # Keyed by int user ID in memory; Config keeps the str keys JSON needs, converted once on load
+        self._apps_cache: Dict[int, Dict[int, Dict]] = {}
+        self._app_status: Dict[int, Dict[int, AppStatus]] = {}  # Derived from _apps_cache, same keys
+        self._pending_ids: Dict[int, Tuple[int, ...]] = {}  # Derived: user IDs of pending applications
+        self._interview_channels: Dict[int, Dict[int, int]] = {}  # Derived: interview channel ID -> user ID
+        self._cleanup_due: Dict[int, Dict[int, float]] = {}  # Derived: user ID -> cleanup_scheduled_at as epoch seconds
+        self._compiled_forms: Dict[int, Tuple[CompiledField, ...]] = {}
+        # Form field edits are applied to the cache immediately and written to Config once per burst
+        self._form_field_locks: Dict[int, asyncio.Lock] = {}
+        self._dirty_fields: Dict[int, List[Dict]] = {}
+        self._pending_flush: Dict[int, asyncio.TimerHandle] = {}
+        # Bumped on every form field edit; lets derived renders (field manager embed) skip rebuilding
+        self._fields_version: Dict[int, int] = {}
+        self._manager_embed_cache: Dict[int, Tuple[int, discord.Embed]] = {}
+        self._field_options_cache: Dict[int, Tuple[int, List[discord.SelectOption]]] = {}
+        self._modal_classes: Dict[int, Tuple[int, type]] = {}
+        # Manager role IDs per guild, loaded in cog_load so permission checks on buttons stay synchronous
+        self._manager_role_ids: Dict[int, frozenset] = {}
+        self._bypass_role_ids: Dict[int, frozenset] = {}  # Rebuilt with the settings cache
+        self._cleanup_deltas: Dict[int, timedelta] = {}  # Derived from cleanup_delay, same lifetime
+        self._cleanup_sem = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
+        self._access_roles: Dict[int, Tuple[discord.Role, ...]] = {}  # Resolved access_roles; dropped on change/role delete
+        # Per-guild settings snapshot (everything except applications and form_fields, cached separately)
+        self._guild_cache: Dict[int, Dict] = {}
+        self._embed_colors: Dict[int, Tuple[float, discord.Colour]] = {}  # guild_id -> (expires_at, color)
+        # Review button custom_id prefix -> handler; the applicant's user ID is the custom_id suffix
+        self._review_actions = {
+            _APPROVE_CUSTOM_ID_PREFIX: self._review_approve,
+            _DENY_CUSTOM_ID_PREFIX: self._review_deny,
+            _INTERVIEW_CUSTOM_ID_PREFIX: self._review_interview,
+        }
         log.info("Applications cog initialized")
 
     async def cog_load(self):
         """Called when the cog is loaded. Re-register persistent views per section 0."""
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            self._cache_settings(guild_id, guild_data)
+            self._cache_applications(guild_id, guild_data.get("applications") or {})
         self.cleanup_task = self.bot.loop.create_task(self.cleanup_loop())
         # One global lobby panel view (Apply button)
-        self.bot.add_view(LobbyPanelView(self))
+        self._lobby_view = LobbyPanelView(self)
+        self.bot.add_view(self._lobby_view)
         # On full bot restart, guilds may not be loaded yet; defer per-guild view registration until ready
         async def register_guild_views():
             await self.bot.wait_until_ready()
@@ -1898,69 +1793,41 @@ class Applications(commands.Cog):
             self.bot.loop.create_task(register_guild_views())
 
     async def _register_persistent_views_for_guild(self, guild: discord.Guild):
-        """Register lobby panel and per-application review views for one guild. Safe to call multiple times."""
-        lobby_channel_id = await self.config.guild(guild).lobby_channel_id()
+        """Ensure the lobby panel and restart submission timers for one guild. Safe to call multiple times.
+
+        Review buttons need no registration; on_interaction routes them by custom_id.
+        """
+        settings = await self._get_settings(guild)
+        lobby_channel_id = settings["lobby_channel_id"]
         if lobby_channel_id:
             await self.ensure_lobby_panel(guild)
-        applications = await self.config.guild(guild).applications() or {}
-        review_channel_id = await self.config.guild(guild).review_channel_id()
-        for user_id_str, app_data in applications.items():
-            if not isinstance(app_data, dict) or app_data.get("status") != "pending":
-                continue
-            try:
-                user_id = int(user_id_str)
-            except (ValueError, TypeError):
-                continue
-            review_message_id = app_data.get("review_message_id")
-            if not review_channel_id or not review_message_id:
-                continue
-            view = ApplicationReviewView(self, user_id=user_id)
-            self.bot.add_view(view, message_id=review_message_id)
-            channel = guild.get_channel(review_channel_id)
-            if channel:
-                try:
-                    msg = await channel.fetch_message(review_message_id)
-                    if msg and msg.author == self.bot.user:
-                        await msg.edit(view=view)
-                except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                    pass
+        applications = await self.get_applications(guild)
+        pending_ids = self._pending_ids[guild.id]
 
         # Re-start submission timers for members who haven't submitted yet
-        kick_timeout_seconds = await self.config.guild(guild).kick_timeout_seconds()
+        kick_timeout_seconds = settings["kick_timeout_seconds"]
         if kick_timeout_seconds is None:
             kick_timeout_seconds = 86400
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
-        for user_id_str, app_data in applications.items():
-            if not isinstance(app_data, dict):
-                continue
+        now = time.time()
+        for user_id in pending_ids:
+            app_data = applications[user_id]
             if app_data.get("submitted_at") is not None:
                 continue
-            if app_data.get("status") != "pending":
-                continue
-            try:
-                user_id = int(user_id_str)
-            except (ValueError, TypeError):
-                continue
             # Skip if timer already running
             if guild.id in self.timer_tasks and user_id in self.timer_tasks[guild.id]:
                 continue
-            joined_at_str = app_data.get("joined_at")
+            joined_ts = _parse_timestamp(app_data.get("joined_at"))
             remaining = float(kick_timeout_seconds)
-            if joined_at_str:
-                try:
-                    joined_at = datetime.fromisoformat(joined_at_str)
-                    if joined_at.tzinfo is not None:
-                        joined_at = joined_at.replace(tzinfo=None)
-                    elapsed = (now - joined_at).total_seconds()
-                    remaining = max(0.0, kick_timeout_seconds - elapsed)
-                except (ValueError, TypeError):
-                    pass
+            if joined_ts is not None:
+                remaining = max(0.0, kick_timeout_seconds - (now - joined_ts))
             self._start_application_timer(guild.id, user_id, delay_override=remaining)
 
     async def cog_unload(self):
         """Called when the cog is unloaded."""
         if self.cleanup_task:
             self.cleanup_task.cancel()
+        if self._lobby_view is not None:
+            self._lobby_view.stop()
         
         # Cancel all timer tasks
         for guild_tasks in self.timer_tasks.values():
@@ -1969,29 +1836,414 @@ class Applications(commands.Cog):
                     task.cancel()
         self.timer_tasks.clear()
 
+        # Write out any form field edits still waiting on their debounce timer
+        for handle in self._pending_flush.values():
+            handle.cancel()
+        self._pending_flush.clear()
+        for guild_id in list(self._dirty_fields):
+            await self._flush_form_fields(guild_id)
+
+    def _form_fields_cached(self, guild: discord.Guild) -> bool:
+        """Return True if get_form_fields() can answer without reading Config."""
+        return guild.id in self._fields_cache
+
+    async def get_form_fields(self, guild: discord.Guild) -> List[Dict]:
+        """Return the guild's form fields from cache, loading from Config on first use. Do not mutate."""
+        fields = self._fields_cache.get(guild.id)
+        if fields is None:
+            fields = await self.config.guild(guild).form_fields()
+            self._cache_form_fields(guild.id, fields)
+        return fields
+
+    def _cache_form_fields(self, guild_id: int, fields: List[Dict]):
+        """Store a guild's form fields along with their name -> index lookup."""
+        fields_by_name = {}
+        for i, f in enumerate(fields):
+            fields_by_name.setdefault(f.get("name"), i)
+        self._fields_cache[guild_id] = fields
+        self._fields_by_name[guild_id] = fields_by_name
+
+    async def get_compiled_form(self, guild: discord.Guild) -> Tuple[CompiledField, ...]:
+        """Return the guild's form fields compiled for ApplicationModal; rebuilt only after edits."""
+        form = self._compiled_forms.get(guild.id)
+        if form is None:
+            form = _compile_form(await self.get_form_fields(guild))
+            self._compiled_forms[guild.id] = form
+        return form
+
+    async def get_modal_class(self, guild: discord.Guild) -> type:
+        """Return the guild's specialized ApplicationModal subclass, regenerated only after form edits."""
+        version = self._fields_version.get(guild.id, 0)
+        cached = self._modal_classes.get(guild.id)
+        if cached and cached[0] == version:
+            return cached[1]
+        modal_class = _specialize_modal(await self.get_compiled_form(guild))
+        self._modal_classes[guild.id] = (version, modal_class)
+        return modal_class
+
+    async def get_applications(self, guild: discord.Guild) -> Dict[int, Dict]:
+        """Return the guild's applications from cache, loading from Config on first use. Do not mutate."""
+        applications = self._apps_cache.get(guild.id)
+        if applications is None:
+            applications = self._cache_applications(guild.id, await self.config.guild(guild).applications() or {})
+        return applications
+
+    def _cache_applications(self, guild_id: int, applications: Dict[str, Dict]) -> Dict[int, Dict]:
+        """Store a guild's applications (as loaded from Config) by int user ID with their derived indexes."""
+        records = {}
+        statuses = {}
+        pending_ids = []
+        interview_channels = {}
+        cleanup_due = {}
+        for key, app in applications.items():
+            try:
+                user_id = int(key)
+            except (ValueError, TypeError):
+                continue
+            records[user_id] = app
+            if not isinstance(app, dict):
+                continue
+            if app.get("interview_channel_id"):
+                interview_channels[app["interview_channel_id"]] = user_id
+            if app.get("cleanup_scheduled_at"):
+                due_time = _parse_timestamp(app["cleanup_scheduled_at"])
+                if due_time is None:
+                    log.warning("Invalid cleanup_scheduled_at for user %s in guild %s", user_id, guild_id)
+                else:
+                    cleanup_due[user_id] = due_time
+            status = _STATUS_BY_NAME.get(app.get("status"))
+            if status is None:
+                continue
+            statuses[user_id] = status
+            if status is AppStatus.PENDING:
+                pending_ids.append(user_id)
+        self._apps_cache[guild_id] = records
+        self._app_status[guild_id] = statuses
+        self._pending_ids[guild_id] = tuple(pending_ids)
+        self._interview_channels[guild_id] = interview_channels
+        self._cleanup_due[guild_id] = cleanup_due
+        return records
+
+    def _application_status(self, guild_id: int, user_id: int) -> Optional[AppStatus]:
+        """Status code of a cached application; call after get_application()/get_applications()."""
+        return self._app_status.get(guild_id, {}).get(user_id)
+
+    async def _interview_applicant(self, guild: discord.Guild, channel_id: int) -> Optional[discord.Member]:
+        """Return the member whose application owns the given interview channel, if they are still here."""
+        await self.get_applications(guild)
+        user_id = self._interview_channels[guild.id].get(channel_id)
+        return guild.get_member(user_id) if user_id else None
+
+    async def _resolve_application(
+        self, ctx: commands.Context, member: Optional[discord.Member], usage: str
+    ) -> Tuple[Optional[discord.Member], Optional[Dict]]:
+        """Resolve a command's target (defaulting to the interview channel's applicant) and their application.
+
+        Sends the error message and returns (member, None) when there is nothing to act on.
+        """
+        if member is None:
+            member = await self._interview_applicant(ctx.guild, ctx.channel.id)
+            if member is None:
+                await ctx.send(
+                    "❌ No member specified and this doesn't appear to be an interview channel. "
+                    f"Please specify a member: `[p]applications {usage}`"
+                )
+                return None, None
+        app_data = await self.get_application(ctx.guild, member.id)
+        if app_data is None:
+            await ctx.send(f"{member.mention} does not have an active application.")
+        return member, app_data
+
+    async def get_application(self, guild: discord.Guild, user_id: int) -> Optional[Dict]:
+        """Return one member's application record from the cache, or None. Do not mutate."""
+        return (await self.get_applications(guild)).get(user_id)
+
+    async def _save_application(self, guild: discord.Guild, user_id: int, record: Dict):
+        """Write one member's application record; only that record is serialized, not the whole dict."""
+        await self.config.guild(guild).applications.set_raw(str(user_id), value=record)
+        self._cache_application(guild.id, user_id, record)
+        due_time = _parse_timestamp(record.get("cleanup_scheduled_at"))
+        if due_time is not None:
+            self._wake_cleanup_loop(due_time)
+
+    async def _update_application(self, guild: discord.Guild, user_id: int, changes: Dict) -> bool:
+        """Merge changes into an existing application record. Returns False if the member has none."""
+        record = await self.get_application(guild, user_id)
+        if record is None:
+            return False
+        await self._save_application(guild, user_id, {**record, **changes})
+        return True
+
+    async def _set_review_message_id(self, guild: discord.Guild, user_id: int, message_id: int):
+        """Record the review post for an existing application, writing only that key."""
+        record = await self.get_application(guild, user_id)
+        if record is None:
+            return  # Removed meanwhile (e.g. the member left); don't recreate a partial record
+        await self.config.guild(guild).applications.set_raw(str(user_id), "review_message_id", value=message_id)
+        self._cache_application(guild.id, user_id, {**record, "review_message_id": message_id})
+
+    async def _delete_application(self, guild: discord.Guild, user_id: int):
+        """Remove one member's application record, if any."""
+        await self.config.guild(guild).applications.clear_raw(str(user_id))
+        self._cache_application(guild.id, user_id, None)
+        self._drop_decision_lock(guild.id, user_id)
+
+    def _decision_lock(self, guild_id: int, user_id: int) -> asyncio.Lock:
+        """Lock held while checking and resolving one member's pending application."""
+        return self._decision_locks.setdefault((guild_id, user_id), asyncio.Lock())
+
+    def _drop_decision_lock(self, guild_id: int, user_id: int):
+        """Forget an application's decision lock once its record is gone, unless it is held."""
+        lock = self._decision_locks.get((guild_id, user_id))
+        if lock is not None and not lock.locked():
+            del self._decision_locks[(guild_id, user_id)]
+
+    def _cache_application(self, guild_id: int, user_id: int, record: Optional[Dict]):
+        """Apply a single-record write to a loaded applications cache and its derived indexes."""
+        applications = self._apps_cache.get(guild_id)
+        if applications is None:
+            return  # Not loaded yet; get_applications() will read the new state from Config
+        statuses = self._app_status[guild_id]
+        interview_channels = self._interview_channels[guild_id]
+        cleanup_due = self._cleanup_due[guild_id]
+        previous = applications.get(user_id)
+        if isinstance(previous, dict) and previous.get("interview_channel_id"):
+            interview_channels.pop(previous["interview_channel_id"], None)
+        cleanup_due.pop(user_id, None)
+        status = None
+        if record is None:
+            applications.pop(user_id, None)
+        else:
+            applications[user_id] = record
+            status = _STATUS_BY_NAME.get(record.get("status"))
+            if record.get("interview_channel_id"):
+                interview_channels[record["interview_channel_id"]] = user_id
+            due_time = _parse_timestamp(record.get("cleanup_scheduled_at"))
+            if due_time is not None:
+                cleanup_due[user_id] = due_time
+        if status is None:
+            statuses.pop(user_id, None)
+        else:
+            statuses[user_id] = status
+        pending_ids = tuple(uid for uid in self._pending_ids[guild_id] if uid != user_id)
+        if status is AppStatus.PENDING:
+            pending_ids += (user_id,)
+        self._pending_ids[guild_id] = pending_ids
+
+    @asynccontextmanager
+    async def _edit_form_fields(self, guild: discord.Guild):
+        """Mutate a copy of the guild's form fields; changes are cached at once and flushed to Config shortly after."""
+        lock = self._form_field_locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            current = await self.get_form_fields(guild)
+            fields = [dict(f) for f in current]
+            try:
+                yield fields
+            finally:
+                if fields != current:
+                    self._stage_form_fields(guild.id, fields)
+
+    def _stage_form_fields(self, guild_id: int, fields: List[Dict]):
+        """Publish new form fields to the caches and (re)arm the debounced Config write."""
+        self._cache_form_fields(guild_id, fields)
+        self._fields_version[guild_id] = self._fields_version.get(guild_id, 0) + 1
+        self._compiled_forms[guild_id] = _compile_form(fields)
+        self._dirty_fields[guild_id] = fields
+        handle = self._pending_flush.pop(guild_id, None)
+        if handle:
+            handle.cancel()
+        self._pending_flush[guild_id] = self.bot.loop.call_later(
+            _FIELDS_FLUSH_DELAY, self._start_fields_flush, guild_id
+        )
+
+    async def _get_field_manager_embed(self, channel: discord.abc.GuildChannel) -> discord.Embed:
+        """Return the field manager embed for the channel's guild, rebuilt only when its form fields change."""
+        guild = channel.guild
+        version = self._fields_version.get(guild.id, 0)
+        cached = self._manager_embed_cache.get(guild.id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        form = await self.get_compiled_form(guild)
+        embed = discord.Embed(
+            title="📋 Application Form Fields Manager",
+            description="Use the buttons below to manage your application form fields. **Forms may contain at most 5 fields** (Discord limit).",
+            color=await self._embed_color(channel),
+        )
+
+        if not form:
+            embed.add_field(
+                name="No Fields",
+                value="Add your first field using the **Add Field** button below.",
+                inline=False,
+            )
+        else:
+            for i, field in enumerate(form, 1):
+                value_text = f"**Type:** {field.type}\n**Required:** {'Yes' if field.required else 'No'}"
+                if field.configured_placeholder:
+                    value_text += f"\n**Placeholder:** {field.configured_placeholder}"
+                if field.confirm_text:
+                    value_text += f"\n**Must type:** `{field.confirm_text}`"
+
+                embed.add_field(
+                    name=f"{i}. {field.label}",
+                    value=value_text,
+                    inline=False,
+                )
+
+        self._manager_embed_cache[guild.id] = (version, embed)
+        return embed
+
+    async def _get_field_select_options(self, guild: discord.Guild) -> List[discord.SelectOption]:
+        """Return the field picker options, built once per form version and shared by every action menu."""
+        version = self._fields_version.get(guild.id, 0)
+        cached = self._field_options_cache.get(guild.id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        form = await self.get_compiled_form(guild)
+        options = []
+        for i, field in enumerate(form):
+            options.append(
+                discord.SelectOption(
+                    label=f"{i+1}. {field.label[:80]}",
+                    description=f"Type: {field.type} | Name: {field.name}",
+                    value=str(i),
+                    default=False,
+                )
+            )
+
+        if not options:
+            options.append(
+                discord.SelectOption(
+                    label="No fields available",
+                    description="Add a field first",
+                    value="-1",
+                )
+            )
+
+        options = options[:25]  # Discord limit
+        self._field_options_cache[guild.id] = (version, options)
+        return options
+
+    def _start_fields_flush(self, guild_id: int):
+        """TimerHandle callback: write the coalesced form field edits for one guild."""
+        self._pending_flush.pop(guild_id, None)
+        self.bot.loop.create_task(self._flush_form_fields(guild_id))
+
+    async def _flush_form_fields(self, guild_id: int):
+        """Persist the latest staged form fields for a guild, if any."""
+        fields = self._dirty_fields.pop(guild_id, None)
+        if fields is None:
+            return
+        try:
+            await self.config.guild_from_id(guild_id).form_fields.set(fields)
+        except Exception as e:
+            log.error("Failed to save form fields for guild %s: %s", guild_id, e, exc_info=True)
+
+    async def _embed_color(self, channel: discord.abc.GuildChannel) -> discord.Colour:
+        """Return the bot's embed color for the channel's guild, reusing it for _EMBED_COLOR_TTL seconds.
+
+        Pass the channel the embed goes to (like ctx.embed_color()); the result depends only on its guild.
+        """
+        key = channel.guild.id
+        now = self.bot.loop.time()
+        cached = self._embed_colors.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        color = await self.bot.get_embed_color(channel)
+        self._embed_colors[key] = (now + _EMBED_COLOR_TTL, color)
+        return color
+
+    async def _get_settings(self, guild: discord.Guild) -> Dict:
+        """Return the guild's settings from cache, loading them with one Config read on first use. Do not mutate."""
+        settings = self._guild_cache.get(guild.id)
+        if settings is None:
+            settings = self._cache_settings(guild.id, await self.config.guild(guild).all())
+        return settings
+
+    def _cache_settings(self, guild_id: int, guild_data: Dict) -> Dict:
+        """Store a guild's settings snapshot and the values derived from it."""
+        settings = {
+            key: value for key, value in guild_data.items() if key not in ("applications", "form_fields")
+        }
+        self._guild_cache[guild_id] = settings
+        self._cache_manager_roles(guild_id, settings.get("manager_roles"))
+        self._bypass_role_ids[guild_id] = frozenset(settings.get("bypass_roles") or [])
+        self._cleanup_deltas[guild_id] = timedelta(hours=settings.get("cleanup_delay") or 0)
+        self._access_roles.pop(guild_id, None)
+        return settings
+
+    def _store_setting(self, guild_id: int, key: str, value):
+        """Keep the cached settings in step with a value just written to Config."""
+        settings = self._guild_cache.get(guild_id)
+        if settings is not None:
+            settings[key] = value
+        if key == "manager_roles":
+            self._cache_manager_roles(guild_id, value)
+        elif key == "bypass_roles":
+            self._bypass_role_ids[guild_id] = frozenset(value or [])
+        elif key == "cleanup_delay":
+            self._cleanup_deltas[guild_id] = timedelta(hours=value or 0)
+        elif key == "access_roles":
+            self._access_roles.pop(guild_id, None)
+        elif key == "pending_unbans" or (key == "enabled" and value):
+            # May bring a due time forward; the cleanup loop only re-plans if it does
+            due_time = self._next_guild_cleanup(guild_id)
+            if due_time is not None:
+                self._wake_cleanup_loop(due_time)
+
+    async def _cleanup_delta(self, guild: discord.Guild) -> timedelta:
+        """How long after a decision its review artifacts are cleaned up."""
+        await self._get_settings(guild)
+        return self._cleanup_deltas[guild.id]
+
+    async def _set_setting(self, guild: discord.Guild, key: str, value):
+        """Write one guild setting to Config and update the cache."""
+        await self.config.guild(guild).get_attr(key).set(value)
+        self._store_setting(guild.id, key, value)
+
+    async def _set_settings(self, guild: discord.Guild, values: Dict):
+        """Write several independent guild settings to Config concurrently and update the cache."""
+        group = self.config.guild(guild)
+        await asyncio.gather(*(group.get_attr(key).set(value) for key, value in values.items()))
+        for key, value in values.items():
+            self._store_setting(guild.id, key, value)
+
+    @asynccontextmanager
+    async def _edit_setting(self, guild: discord.Guild, key: str):
+        """Mutate a list setting in Config (like `async with group.key() as value`) and update the cache on exit."""
+        async with self.config.guild(guild).get_attr(key)() as value:
+            try:
+                yield value
+            finally:
+                self._store_setting(guild.id, key, value)
+
     async def has_bypass_role(self, member: discord.Member) -> bool:
         """Check if member has any bypass roles."""
-        bypass_roles = await self.config.guild(member.guild).bypass_roles()
+        await self._get_settings(member.guild)  # Loads the bypass role set on first use
+        bypass_roles = self._bypass_role_ids[member.guild.id]
         if not bypass_roles:
             return False
 
-        member_role_ids = [role.id for role in member.roles]
-        return any(role_id in member_role_ids for role_id in bypass_roles)
+        # Member.get_role checks the member's own role IDs; member.roles would resolve and sort all of them
+        return any(member.get_role(role_id) is not None for role_id in bypass_roles)
 
     async def _get_configured_access_roles(self, guild: discord.Guild) -> List[discord.Role]:
         """Return configured access roles that still exist in the guild."""
-        access_role_ids = await self.config.guild(guild).access_roles()
-        if not access_role_ids:
-            return []
-        return [role for rid in access_role_ids if (role := guild.get_role(rid))]
+        roles = self._access_roles.get(guild.id)
+        if roles is None:
+            access_role_ids = (await self._get_settings(guild))["access_roles"] or []
+            roles = tuple(role for rid in access_role_ids if (role := guild.get_role(rid)))
+            self._access_roles[guild.id] = roles
+        return list(roles)
 
     @staticmethod
     def _get_missing_access_roles(
         member: discord.Member, access_roles: List[discord.Role]
     ) -> List[discord.Role]:
         """Return configured access roles the member does not currently have."""
-        member_role_ids = {role.id for role in member.roles}
-        return [role for role in access_roles if role.id not in member_role_ids]
+        return [role for role in access_roles if member.get_role(role.id) is None]
 
     async def _assign_missing_access_roles(
         self,
@@ -2031,14 +2283,14 @@ class Applications(commands.Cog):
             return "http_error", len(missing_access_roles)
 
     async def _embed_from_lobby_data(
-        self, guild: discord.Guild, embed_data: Optional[Dict]
+        self, channel: discord.abc.GuildChannel, embed_data: Optional[Dict]
     ) -> Optional[discord.Embed]:
         """Build a discord.Embed from lobby_embed config dict. Returns None if no title."""
         if not embed_data or not embed_data.get("title"):
             return None
         color = embed_data.get("color")
         if color is None:
-            color = await self.bot.get_embed_color(guild)
+            color = await self._embed_color(channel)
         embed = discord.Embed(
             title=embed_data["title"][:256],
             description=(embed_data.get("description") or "")[:4096],
@@ -2051,10 +2303,10 @@ class Applications(commands.Cog):
         return embed
 
     async def send_lobby_panel(self, channel: discord.TextChannel) -> Optional[discord.Message]:
-        """Send or resend the lobby panel (embed + Apply button). Registers view per section 0. Returns the message or None."""
-        lobby_embed_data = await self.config.guild(channel.guild).lobby_embed()
+        """Send or resend the lobby panel (embed + shared Apply button view). Returns the message or None."""
+        lobby_embed_data = (await self._get_settings(channel.guild))["lobby_embed"]
         if lobby_embed_data and lobby_embed_data.get("title"):
-            embed = await self._embed_from_lobby_data(channel.guild, lobby_embed_data)
+            embed = await self._embed_from_lobby_data(channel, lobby_embed_data)
         else:
             embed = discord.Embed(
                 title="Welcome! Please Complete Your Application",
@@ -2062,13 +2314,12 @@ class Applications(commands.Cog):
                     "Thank you for joining! Before you can access the full server, "
                     "you need to complete an application. Click the button below to get started."
                 ),
-                color=await self.bot.get_embed_color(channel.guild),
+                color=await self._embed_color(channel),
             )
             embed.set_footer(text="Your application will be reviewed by our staff team.")
-        view = LobbyPanelView(self)
-        self.bot.add_view(view)
+        # The Apply button is identical for every panel; reuse the view registered in cog_load
         try:
-            msg = await channel.send(embed=embed, view=view)
+            msg = await channel.send(embed=embed, view=self._lobby_view)
             return msg
         except discord.HTTPException as e:
             log.error("Error sending lobby panel: %s", e)
@@ -2077,10 +2328,10 @@ class Applications(commands.Cog):
     async def _run_config_checks(self, guild: discord.Guild) -> List[Dict]:
         """Run configuration checks. Returns list of {name, passed, message, fixable, fix_action}."""
         results = []
-        guild_config = self.config.guild(guild)
+        settings = await self._get_settings(guild)
 
         # Lobby channel
-        lobby_channel_id = await guild_config.lobby_channel_id()
+        lobby_channel_id = settings["lobby_channel_id"]
         lobby_ok = bool(lobby_channel_id and guild.get_channel(lobby_channel_id))
         results.append({
             "name": "Lobby channel",
@@ -2090,7 +2341,7 @@ class Applications(commands.Cog):
         })
 
         # Review channel
-        review_channel_id = await guild_config.review_channel_id()
+        review_channel_id = settings["review_channel_id"]
         review_ok = bool(review_channel_id and guild.get_channel(review_channel_id))
         results.append({
             "name": "Review channel",
@@ -2100,7 +2351,7 @@ class Applications(commands.Cog):
         })
 
         # Log channel
-        log_channel_id = await guild_config.log_channel()
+        log_channel_id = settings["log_channel"]
         log_ok = not log_channel_id or bool(guild.get_channel(log_channel_id))
         results.append({
             "name": "Log channel",
@@ -2110,7 +2361,7 @@ class Applications(commands.Cog):
         })
 
         # Panel message in lobby
-        panel_message_id = await guild_config.lobby_panel_message_id()
+        panel_message_id = settings["lobby_panel_message_id"]
         panel_ok = False
         if lobby_channel_id and panel_message_id:
             ch = guild.get_channel(lobby_channel_id)
@@ -2130,8 +2381,8 @@ class Applications(commands.Cog):
         })
 
         # Role system
-        restricted_role_id = await guild_config.restricted_role()
-        access_roles = await guild_config.access_roles()
+        restricted_role_id = settings["restricted_role"]
+        access_roles = settings["access_roles"]
         role_ok = bool(restricted_role_id and guild.get_role(restricted_role_id)) or bool(access_roles and any(guild.get_role(r) for r in access_roles))
         results.append({
             "name": "Role system",
@@ -2141,7 +2392,7 @@ class Applications(commands.Cog):
         })
 
         # Manager roles
-        manager_roles = await guild_config.manager_roles()
+        manager_roles = settings["manager_roles"]
         manager_ok = not manager_roles or any(guild.get_role(r) for r in manager_roles)
         results.append({
             "name": "Manager roles",
@@ -2151,7 +2402,7 @@ class Applications(commands.Cog):
         })
 
         # Form fields
-        form_fields = await guild_config.form_fields()
+        form_fields = await self.get_form_fields(guild)
         form_ok = bool(form_fields and len(form_fields) >= 1)
         results.append({
             "name": "Form fields",
@@ -2167,8 +2418,9 @@ class Applications(commands.Cog):
         if guild.id not in self._lobby_panel_locks:
             self._lobby_panel_locks[guild.id] = asyncio.Lock()
         async with self._lobby_panel_locks[guild.id]:
-            lobby_channel_id = await self.config.guild(guild).lobby_channel_id()
-            panel_message_id = await self.config.guild(guild).lobby_panel_message_id()
+            settings = await self._get_settings(guild)
+            lobby_channel_id = settings["lobby_channel_id"]
+            panel_message_id = settings["lobby_panel_message_id"]
             if not lobby_channel_id:
                 return False
             channel = guild.get_channel(lobby_channel_id)
@@ -2183,10 +2435,19 @@ class Applications(commands.Cog):
                     pass
             msg = await self.send_lobby_panel(channel)
             if msg:
-                await self.config.guild(guild).lobby_panel_message_id.set(msg.id)
+                await self._set_setting(guild, "lobby_panel_message_id", msg.id)
                 return True
             return False
 
+    async def _ensure_lobby_panel_shared(self, guild: discord.Guild) -> bool:
+        """ensure_lobby_panel() for join bursts: members joining while a check runs share its result."""
+        task = self._lobby_panel_checks.get(guild.id)
+        if task is None or task.done():
+            task = self.bot.loop.create_task(self.ensure_lobby_panel(guild))
+            self._lobby_panel_checks[guild.id] = task
+        # Shielded so one cancelled listener does not cancel the check for the others
+        return await asyncio.shield(task)
+
     def _format_timeout(self, seconds: int) -> str:
         """Format a duration in seconds as a human-readable string (e.g. '24 hours', '30 minutes')."""
         if seconds < 60:
@@ -2214,9 +2475,9 @@ class Applications(commands.Cog):
 
     async def _is_debug_bypass_user(self, guild: discord.Guild, user_id: int) -> bool:
         """Return True if debug bypass is enabled for this user in the guild."""
-        g = self.config.guild(guild)
-        enabled = await g.debug_bypass_enabled()
-        debug_user_id = await g.debug_bypass_user_id()
+        settings = await self._get_settings(guild)
+        enabled = settings["debug_bypass_enabled"]
+        debug_user_id = settings["debug_bypass_user_id"]
         return bool(enabled and debug_user_id and int(debug_user_id) == int(user_id))
 
     async def _send_approval_dm(self, guild: discord.Guild, member: discord.Member) -> None:
@@ -2301,7 +2562,7 @@ class Applications(commands.Cog):
             try:
                 await guild.ban(member, reason=reason)
                 unban_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=duration)
-                async with self.config.guild(guild).pending_unbans() as pending:
+                async with self._edit_setting(guild, "pending_unbans") as pending:
                     pending.append({"user_id": member.id, "unban_at": unban_at.isoformat()})
                 log.info(
                     f"Tempbanned {member.display_name} ({member.id}) from {guild.name} for {duration}s ({context})"
@@ -2326,7 +2587,7 @@ class Applications(commands.Cog):
                 if delay_override is not None:
                     timeout_seconds = delay_override
                 else:
-                    timeout_seconds = await self.config.guild(guild).kick_timeout_seconds()
+                    timeout_seconds = (await self._get_settings(guild))["kick_timeout_seconds"]
                     if timeout_seconds is None:
                         timeout_seconds = 86400
                 # Wait for the configured duration
@@ -2345,8 +2606,7 @@ class Applications(commands.Cog):
                     return
                 
                 # Check application status
-                applications = await self.config.guild(guild).applications()
-                app_data = applications.get(str(user_id))
+                app_data = await self.get_application(guild, user_id)
                 
                 if not app_data:
                     log.warning(f"Application data not found for user {user_id} in guild {guild_id}")
@@ -2359,7 +2619,7 @@ class Applications(commands.Cog):
                     return
                 
                 # Application not submitted - proceed with kick
-                rejoin_invite = await self.config.guild(guild).rejoin_invite()
+                rejoin_invite = (await self._get_settings(guild))["rejoin_invite"]
                 
                 # Try to DM user with invite link if configured
                 if rejoin_invite:
@@ -2409,19 +2669,26 @@ class Applications(commands.Cog):
             self.timer_tasks[guild_id] = {}
         self.timer_tasks[guild_id][user_id] = task
 
-    async def can_manage_applications(self, user: discord.Member, guild: discord.Guild) -> bool:
-        """Check if user can manage applications (admin or manager role)."""
+    def can_manage_applications_sync(self, user: discord.Member, guild: discord.Guild) -> bool:
+        """Check if user can manage applications (admin or manager role). Reads only cached role IDs."""
         # Check if user has manage_guild permission (admin)
         if user.guild_permissions.manage_guild:
             return True
 
         # Check manager roles
-        manager_roles = await self.config.guild(guild).manager_roles()
+        manager_roles = self._manager_role_ids.get(guild.id)
         if not manager_roles:
             return False
 
-        user_role_ids = [role.id for role in user.roles]
-        return any(role_id in user_role_ids for role_id in manager_roles)
+        return any(user.get_role(role_id) is not None for role_id in manager_roles)
+
+    def _get_manager_roles(self, guild: discord.Guild) -> List[discord.Role]:
+        """Return the cached manager roles that still exist in the guild."""
+        return [role for rid in self._manager_role_ids.get(guild.id, ()) if (role := guild.get_role(rid))]
+
+    def _cache_manager_roles(self, guild_id: int, role_ids: List[int]):
+        """Record a guild's manager role IDs for can_manage_applications_sync."""
+        self._manager_role_ids[guild_id] = frozenset(role_ids or [])
 
     async def submit_application(
         self, member: discord.Member, responses: Dict[str, str]
@@ -2436,55 +2703,63 @@ class Applications(commands.Cog):
                 - "review_channel_not_found"
                 - "review_channel_post_failed"
         """
-        review_channel_id = await self.config.guild(member.guild).review_channel_id()
+        settings = await self._get_settings(member.guild)
+        review_channel_id = settings["review_channel_id"]
         if not review_channel_id:
             log.warning("Review channel is not configured for guild %s", member.guild.id)
             return False, "review_channel_not_configured"
         guild_id = member.guild.id
         user_id = member.id
+        now_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
         app_record = {
             "status": "pending",
-            "submitted_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+            "submitted_at": now_iso,
             "responses": responses,
             "review_message_id": None,
             "interview_channel_id": None,
         }
         debug_bypass = await self._is_debug_bypass_user(member.guild, member.id)
         previous_app_state: Optional[Dict] = None
-        async with self.config.guild(member.guild).applications() as applications:
-            existing = applications.get(str(member.id), {})
-            if isinstance(existing, dict):
-                previous_app_state = dict(existing)
-            already_submitted = bool(
-                isinstance(existing, dict)
-                and (
-                    existing.get("submitted_at") is not None
-                    or bool(existing.get("responses"))
-                    or existing.get("status") in {"approved", "denied"}
-                )
+        applications = await self.get_applications(member.guild)
+        # No awaits from here until the record is claimed in the cache, so a double submit sees "duplicate"
+        existing = applications.get(member.id, {})
+        if isinstance(existing, dict):
+            previous_app_state = dict(existing)
+        already_submitted = bool(
+            isinstance(existing, dict)
+            and (
+                existing.get("submitted_at") is not None
+                or bool(existing.get("responses"))
+                or existing.get("status") in {"approved", "denied"}
             )
-            if already_submitted and not debug_bypass:
-                return False, "duplicate"
-
-            if debug_bypass:
-                # Reset stale moderation/cleanup fields so repeated test runs behave like a fresh submission.
-                existing_joined_at = existing.get("joined_at") if isinstance(existing, dict) else None
-                applications[str(member.id)] = {
-                    "joined_at": existing_joined_at or datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
-                    **app_record,
-                }
-            else:
-                if str(member.id) not in applications:
-                    applications[str(member.id)] = {}
-                applications[str(member.id)].update(app_record)
+        )
+        if already_submitted and not debug_bypass:
+            return False, "duplicate"
+
+        if debug_bypass:
+            # Reset stale moderation/cleanup fields so repeated test runs behave like a fresh submission.
+            existing_joined_at = existing.get("joined_at") if isinstance(existing, dict) else None
+            new_record = {
+                "joined_at": existing_joined_at or now_iso,
+                **app_record,
+            }
+        else:
+            new_record = {**(existing if isinstance(existing, dict) else {}), **app_record}
+        # Claim in the cache before the first await, then persist before posting for review
+        previous_record = applications.get(member.id)
+        self._cache_application(guild_id, user_id, new_record)
+        try:
+            await self._save_application(member.guild, user_id, new_record)
+        except Exception:
+            self._cache_application(guild_id, user_id, previous_record)
+            raise
 
         async def restore_application_state_after_failure():
             """Rollback submit state if review message cannot be posted."""
-            async with self.config.guild(member.guild).applications() as applications:
-                if previous_app_state is None:
-                    applications.pop(str(member.id), None)
-                else:
-                    applications[str(member.id)] = previous_app_state
+            if previous_record is None:
+                await self._delete_application(member.guild, user_id)
+            else:
+                await self._save_application(member.guild, user_id, previous_record)
 
             # Keep timeout enforcement active for users that still have an unsubmitted application.
             needs_timer = previous_app_state is None or previous_app_state.get("submitted_at") is None
@@ -2504,47 +2779,54 @@ class Applications(commands.Cog):
                 del self.timer_tasks[guild_id]
 
         # Create review embed
+        form_fields = await self.get_form_fields(member.guild)
         embed = await self.create_review_embed(member, responses, "pending")
 
-        # Create review view with approve/deny (and later interview) buttons; register for persistence (section 0)
-        view = ApplicationReviewView(self, member=member)
+        # Approve/deny/interview buttons; clicks are handled by on_interaction, not by this view
+        view = ApplicationReviewView(member.id)
 
         notification_role = None
-        notification_role_id = await self.config.guild(member.guild).notification_role()
+        notification_role_id = settings["notification_role"]
         if notification_role_id:
             notification_role = member.guild.get_role(notification_role_id)
             if not notification_role:
-                await self.config.guild(member.guild).notification_role.set(None)
+                await self._set_setting(member.guild, "notification_role", None)
                 log.warning(f"Notification role {notification_role_id} not found in {member.guild.name}")
 
-        allowed_mentions = discord.AllowedMentions(roles=[notification_role]) if notification_role else None
-
         # Review channel is admin-only: send only the notification ping (if any), no applicant-facing "received" text
-        review_content = (f"{notification_role.mention}\n" if notification_role else None)
+        review_content = None
+        ping_kwargs = {}
+        if notification_role:
+            review_content = f"{notification_role.mention}\n"
+            ping_kwargs["allowed_mentions"] = discord.AllowedMentions(roles=[notification_role])
         review_channel = member.guild.get_channel(review_channel_id)
         if review_channel and isinstance(review_channel, discord.TextChannel):
             try:
-                msg = await review_channel.send(
-                    content=review_content,
-                    embed=embed,
-                    view=view,
-                    allowed_mentions=allowed_mentions,
-                )
-                self.bot.add_view(view, message_id=msg.id)
-                async with self.config.guild(member.guild).applications() as applications:
-                    if str(member.id) in applications:
-                        applications[str(member.id)]["review_message_id"] = msg.id
+                msg = await review_channel.send(content=review_content, embed=embed, view=view, **ping_kwargs)
             except (discord.Forbidden, discord.HTTPException) as e:
                 log.error("Failed to post application to review channel: %s", e)
                 await restore_application_state_after_failure()
                 return False, "review_channel_post_failed"
+            # send() stores timeout-less views for dispatch; drop it so nothing is retained per application
+            view.stop()
         else:
             log.warning("Review channel %s not found for guild %s", review_channel_id, member.guild.name)
             await restore_application_state_after_failure()
             return False, "review_channel_not_found"
 
         log.info(f"Application submitted by {member.display_name} in {member.guild.name}")
-        await self.log_application_event(member.guild, member, "submitted", responses=responses)
+        # Independent once the review post exists: store its message ID and log, together.
+        # Only that key is written, so a decision made meanwhile is kept.
+        results = await asyncio.gather(
+            self._set_review_message_id(member.guild, member.id, msg.id),
+            self.log_application_event(
+                member.guild, member, "submitted", responses=responses, form_fields=form_fields
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("Error finishing submission for %s in %s", member.id, member.guild.id, exc_info=result)
         return True, None
 
     async def _update_review_message_after_resolve(
@@ -2556,17 +2838,14 @@ class Applications(commands.Cog):
         reason: Optional[str] = None,
     ) -> None:
         """Edit the review channel message to show approved/denied and remove the view. Optional delete interview channel."""
-        review_channel_id = await self.config.guild(guild).review_channel_id()
+        settings = await self._get_settings(guild)
+        review_channel_id = settings["review_channel_id"]
         review_message_id = app_data.get("review_message_id")
         if not review_channel_id or not review_message_id:
             return
         channel = guild.get_channel(review_channel_id)
         if not channel or not isinstance(channel, discord.TextChannel):
             return
-        try:
-            msg = await channel.fetch_message(review_message_id)
-        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-            return
         embed = await self.create_review_embed(
             member, app_data.get("responses", {}), new_status
         )
@@ -2580,11 +2859,12 @@ class Applications(commands.Cog):
         if reason and new_status == "denied":
             content += f"\nReason: {reason[:500]}"
         try:
-            await msg.edit(content=content, embed=embed, view=None)
-        except (discord.Forbidden, discord.HTTPException):
+            # Edit by ID: a single PATCH, no GET for a message we only replace wholesale
+            await channel.get_partial_message(review_message_id).edit(content=content, embed=embed, view=None)
+        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
             pass
         # Optionally delete interview channel
-        if await self.config.guild(guild).delete_interview_on_resolve():
+        if settings["delete_interview_on_resolve"]:
             interview_channel_id = app_data.get("interview_channel_id")
             if interview_channel_id:
                 ich = guild.get_channel(interview_channel_id)
@@ -2602,26 +2882,28 @@ class Applications(commands.Cog):
         decision_maker: Optional[discord.Member] = None,
         reason: Optional[str] = None,
         responses: Optional[Dict[str, str]] = None,
+        form_fields: Optional[List[Dict]] = None,
     ):
-        """Log an application event to the log channel."""
-        log_channel_id = await self.config.guild(guild).log_channel()
+        """Log an application event to the log channel. form_fields is passed through to the submission embed."""
+        settings = await self._get_settings(guild)
+        log_channel_id = settings["log_channel"]
         if not log_channel_id:
             return
 
-        review_channel_id = await self.config.guild(guild).review_channel_id()
+        review_channel_id = settings["review_channel_id"]
         if event_type == "submitted" and review_channel_id and log_channel_id == review_channel_id:
             return
 
         log_channel = guild.get_channel(log_channel_id)
         if not log_channel or not isinstance(log_channel, discord.TextChannel):
             # Channel was deleted, clear from config
-            await self.config.guild(guild).log_channel.set(None)
+            await self._set_setting(guild, "log_channel", None)
             log.warning(f"Log channel {log_channel_id} not found in {guild.name}")
             return
 
         # Create embed based on event type
         if event_type == "submitted":
-            embed = await self.create_log_embed(member, "submitted", responses=responses)
+            embed = await self.create_log_embed(member, "submitted", responses=responses, form_fields=form_fields)
             content = ""
         elif event_type == "approved":
             embed = await self.create_log_embed(member, "approved", decision_maker=decision_maker)
@@ -2653,8 +2935,9 @@ class Applications(commands.Cog):
         decision_maker: Optional[discord.Member] = None,
         reason: Optional[str] = None,
         responses: Optional[Dict[str, str]] = None,
+        form_fields: Optional[List[Dict]] = None,
     ) -> discord.Embed:
-        """Create an embed for logging application events."""
+        """Create an embed for logging application events. Pass form_fields if the caller already has them."""
         status_colors = {
             "submitted": discord.Color.orange(),
             "approved": discord.Color.green(),
@@ -2675,8 +2958,9 @@ class Applications(commands.Cog):
             timestamp=discord.utils.utcnow(),
         )
 
-        embed.set_author(name=member.display_name, icon_url=member.display_avatar.url)
-        embed.set_thumbnail(url=member.display_avatar.url)
+        avatar_url = member.display_avatar.url
+        embed.set_author(name=member.display_name, icon_url=avatar_url)
+        embed.set_thumbnail(url=avatar_url)
 
         # Add user info
         embed.add_field(
@@ -2685,30 +2969,32 @@ class Applications(commands.Cog):
             inline=True,
         )
 
+        created_ts, joined_ts = _member_timestamps(member)
         embed.add_field(
             name="Account Created",
-            value=f"<t:{int(member.created_at.timestamp())}:R>",
+            value=f"<t:{created_ts}:R>",
             inline=True,
         )
 
         embed.add_field(
             name="Joined Server",
-            value=f"<t:{int(member.joined_at.timestamp())}:R>",
+            value=f"<t:{joined_ts}:R>" if joined_ts is not None else "Unknown",
             inline=True,
         )
 
         # Add form responses for submissions
         if event_type == "submitted" and responses:
-            form_fields = await self.config.guild(member.guild).form_fields()
+            if form_fields is None:
+                form_fields = await self.get_form_fields(member.guild)
             responses_text = ""
             for field in form_fields:
                 field_name = field.get("name")
                 field_label = field.get("label", field_name)
-                response = responses.get(field_name, "Not provided")
+                response = responses.get(field_name) or "Not provided"
                 # Truncate long responses
-                if len(str(response)) > 500:
-                    response = str(response)[:497] + "..."
-                responses_text += f"**{field_label}:** {box(str(response), lang='')}\n"
+                if len(response) > 500:
+                    response = response[:497] + "..."
+                responses_text += f"**{field_label}:** {box(response, lang='')}\n"
 
             if responses_text:
                 embed.add_field(name="Application Responses", value=responses_text, inline=False)
@@ -2730,7 +3016,10 @@ class Applications(commands.Cog):
         return embed
 
     async def create_review_embed(
-        self, member: discord.Member, responses: Dict[str, str], status: str
+        self,
+        member: discord.Member,
+        responses: Dict[str, str],
+        status: str,
     ) -> discord.Embed:
         """Create an embed showing application details."""
         status_colors = {
@@ -2745,31 +3034,25 @@ class Applications(commands.Cog):
             timestamp=discord.utils.utcnow(),
         )
 
-        embed.set_author(name=member.display_name, icon_url=member.display_avatar.url)
-        embed.set_thumbnail(url=member.display_avatar.url)
+        avatar_url = member.display_avatar.url
+        embed.set_author(name=member.display_name, icon_url=avatar_url)
+        embed.set_thumbnail(url=avatar_url)
 
-        # Add form responses
-        form_fields = await self.config.guild(member.guild).form_fields()
-        for field in form_fields:
-            field_name = field.get("name")
-            field_label = field.get("label", field_name)
-            response = responses.get(field_name, "Not provided")
+        # Add form responses; the compiled form already has each field's name and full label resolved
+        for field in await self.get_compiled_form(member.guild):
+            # Responses are TextInput values, already str; blank optional answers show as not provided
+            response = responses.get(field.name) or "Not provided"
 
             # Truncate long responses
-            if len(str(response)) > 1024:
-                response = str(response)[:1021] + "..."
+            if len(response) > 1024:
+                response = response[:1021] + "..."
 
-            embed.add_field(name=field_label, value=box(str(response)), inline=False)
+            embed.add_field(name=field.label, value=box(response), inline=False)
 
         # Add user info
         embed.add_field(
             name="User Information",
-            value=(
-                f"**User:** {member.mention} ({member.display_name})\n"
-                f"**ID:** {member.id}\n"
-                f"**Account Created:** <t:{int(member.created_at.timestamp())}:R>\n"
-                f"**Joined Server:** <t:{int(member.joined_at.timestamp())}:R>"
-            ),
+            value=_format_user_block(member.id, member.display_name, *_member_timestamps(member)),
             inline=False,
         )
 
@@ -2779,17 +3062,151 @@ class Applications(commands.Cog):
             inline=True,
         )
 
-        embed.set_footer(text=f"Guild: {member.guild.name}")
-
-        return embed
-
+        embed.set_footer(text=f"Guild: {member.guild.name}")
+
+        return embed
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Dispatch review button clicks (approve/deny/interview) by their custom_id."""
+        if interaction.type is not discord.InteractionType.component or interaction.guild is None:
+            return
+        custom_id = (interaction.data or {}).get("custom_id") or ""
+        prefix, sep, user_id = custom_id.rpartition(":")
+        handler = self._review_actions.get(prefix + sep)
+        if handler is None or not user_id.isdigit():
+            return
+        await handler(interaction, int(user_id))
+
+    async def _get_review_member(
+        self, interaction: discord.Interaction, user_id: int
+    ) -> Optional[discord.Member]:
+        """Resolve the applicant for a review button click and check the clicker may manage applications."""
+        guild = interaction.guild
+        # Resolve at click time so role checks see the applicant's current roles
+        member = guild.get_member(user_id)
+        if not member:
+            await interaction.response.send_message(
+                "❌ Applicant is no longer in the server.", ephemeral=True
+            )
+            return None
+        if not self.can_manage_applications_sync(interaction.user, guild):
+            await interaction.response.send_message(
+                "❌ You don't have permission to manage applications.", ephemeral=True
+            )
+            return None
+        return member
+
+    async def _check_review_pending(self, interaction: discord.Interaction, member: discord.Member) -> bool:
+        """Return True if the member's application is still pending; otherwise tell the clicker why not."""
+        guild = interaction.guild
+        app_data = await self.get_application(guild, member.id)
+        if app_data is None:
+            await interaction.response.send_message(
+                f"❌ {member.mention} does not have an active application.", ephemeral=True
+            )
+            return False
+
+        if self._application_status(guild.id, member.id) is not AppStatus.PENDING:
+            await interaction.response.send_message(
+                f"❌ This application is already {app_data.get('status')}.", ephemeral=True
+            )
+            return False
+        return True
+
+    async def _review_approve(self, interaction: discord.Interaction, user_id: int):
+        """Approve button: approve the application."""
+        member = await self._get_review_member(interaction, user_id)
+        if member is None or not await self._check_review_pending(interaction, member):
+            return
+        await self.approve_application_interaction(interaction, member)
+
+    async def _review_deny(self, interaction: discord.Interaction, user_id: int):
+        """Deny button: open the denial modal."""
+        member = await self._get_review_member(interaction, user_id)
+        if member is None or not await self._check_review_pending(interaction, member):
+            return
+        await interaction.response.send_modal(DenyModal(self, member))
+
+    async def _review_interview(self, interaction: discord.Interaction, user_id: int):
+        """Interview button: open an interview channel for the applicant."""
+        member = await self._get_review_member(interaction, user_id)
+        if member is None:
+            return
+        guild = interaction.guild
+        app_data = await self.get_application(guild, member.id)
+        if app_data is None:
+            await interaction.response.send_message(
+                f"❌ No active application for {member.mention}.", ephemeral=True
+            )
+            return
+        interview_channel_id = app_data.get("interview_channel_id")
+        if interview_channel_id:
+            ch = guild.get_channel(interview_channel_id)
+            if ch:
+                await interaction.response.send_message(
+                    f"Interview channel already exists: {ch.mention}",
+                    ephemeral=True,
+                )
+                return
+        # Create interview channel (use same category as review channel if possible)
+        settings = await self._get_settings(guild)
+        review_channel_id = settings["review_channel_id"]
+        category = None
+        if review_channel_id:
+            ch = guild.get_channel(review_channel_id)
+            if ch and getattr(ch, "category", None):
+                category = ch.category
+        channel_name = f"interview-{member.display_name.lower().translate(_SPACE_TO_DASH)[:20]}"
+        manager_roles = self._get_manager_roles(guild)
+        # One overwrite shared by every manager role; discord.py only reads it when building the payload
+        staff_overwrite = discord.PermissionOverwrite(
+            view_channel=True,
+            send_messages=True,
+            read_message_history=True,
+            manage_messages=True,
+        )
+        overwrites = {
+            guild.default_role: discord.PermissionOverwrite(view_channel=False),
+            member: discord.PermissionOverwrite(
+                view_channel=True, send_messages=True, read_message_history=True
+            ),
+        }
+        overwrites.update(dict.fromkeys(manager_roles, staff_overwrite))
+        try:
+            new_channel = await guild.create_text_channel(
+                name=channel_name,
+                category=category,
+                overwrites=overwrites,
+                reason=f"Interview channel for {member.display_name}",
+            )
+        except (discord.Forbidden, discord.HTTPException) as e:
+            log.error("Failed to create interview channel: %s", e)
+            await interaction.response.send_message(
+                "❌ Could not create interview channel. Check bot permissions.",
+                ephemeral=True,
+            )
+            return
+        await self._update_application(guild, member.id, {"interview_channel_id": new_channel.id})
+        try:
+            await new_channel.send(
+                f"{member.mention}, an interview has been requested by {interaction.user.mention}."
+            )
+        except discord.HTTPException:
+            pass
+        await interaction.response.send_message(
+            f"✅ Interview channel created: {new_channel.mention}",
+            ephemeral=True,
+        )
+
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         """Handle new member join."""
         if member.bot:
             return
 
-        if not await self.config.guild(member.guild).enabled():
+        settings = await self._get_settings(member.guild)
+        if not settings["enabled"]:
             return
 
         # Check for bypass roles
@@ -2827,23 +3244,25 @@ class Applications(commands.Cog):
             log.info(f"Member {member.display_name} has bypass role, skipping application")
             return
 
-        lobby_channel_id = await self.config.guild(member.guild).lobby_channel_id()
+        lobby_channel_id = settings["lobby_channel_id"]
         if not lobby_channel_id:
             log.warning("Lobby channel not configured for guild %s; skipping application onboarding", member.guild.id)
             return
 
         # Check if user already has an active application
-        applications = await self.config.guild(member.guild).applications()
-        if str(member.id) in applications:
-            app_data = applications[str(member.id)]
-            if app_data.get("status") == "pending":
+        if await self.get_application(member.guild, member.id) is not None:
+            if self._application_status(member.guild.id, member.id) is AppStatus.PENDING:
                 log.info(f"Member {member.display_name} already has pending application")
-                await self.ensure_lobby_panel(member.guild)
+                await self._ensure_lobby_panel_shared(member.guild)
                 return
 
-        # Assign restricted role (if configured)
-        restricted_role_id = await self.config.guild(member.guild).restricted_role()
-        if restricted_role_id:
+        async def assign_restricted_role():
+            """Assign restricted role (if configured)."""
+            restricted_role_id = settings["restricted_role"]
+            if not restricted_role_id:
+                return
+            if member.get_role(restricted_role_id):
+                return  # Already applied (e.g. by a role-persistence bot); skip the API call
             restricted_role = member.guild.get_role(restricted_role_id)
             if restricted_role:
                 try:
@@ -2856,15 +3275,28 @@ class Applications(commands.Cog):
             else:
                 log.warning(f"Restricted role {restricted_role_id} not found in {member.guild.name}")
 
-        # New flow: no per-user channel; ensure lobby panel exists; create app record; start timer
-        await self.ensure_lobby_panel(member.guild)
-        async with self.config.guild(member.guild).applications() as applications:
-            applications[str(member.id)] = {
-                "status": "pending",
-                "submitted_at": None,
-                "responses": {},
-                "joined_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
-            }
+        # New flow: no per-user channel; ensure lobby panel exists; create app record; start timer.
+        # The role assignment, panel check and record write don't depend on each other, so overlap them.
+        results = await asyncio.gather(
+            assign_restricted_role(),
+            self._ensure_lobby_panel_shared(member.guild),
+            self._save_application(
+                member.guild,
+                member.id,
+                {
+                    "status": "pending",
+                    "submitted_at": None,
+                    "responses": {},
+                    "joined_at": datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+                },
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("Error setting up application for %s in %s", member.id, member.guild.id, exc_info=result)
+        if isinstance(results[2], Exception):
+            return  # No pending record was written, so there is nothing for a kick timer to enforce
         self._start_application_timer(member.guild.id, member.id)
 
     @commands.Cog.listener()
@@ -2876,10 +3308,10 @@ class Applications(commands.Cog):
         if before.guild.id != after.guild.id or before.id != after.id:
             return
 
-        if not await self.config.guild(after.guild).enabled():
+        if not (await self._get_settings(after.guild))["enabled"]:
             return
 
-        bypass_role_ids = await self.config.guild(after.guild).bypass_roles()
+        bypass_role_ids = self._bypass_role_ids[after.guild.id]
         if not bypass_role_ids:
             return
 
@@ -2888,8 +3320,8 @@ class Applications(commands.Cog):
         if before_role_ids == after_role_ids:
             return
 
-        had_bypass_before = any(role_id in before_role_ids for role_id in bypass_role_ids)
-        has_bypass_now = any(role_id in after_role_ids for role_id in bypass_role_ids)
+        had_bypass_before = not bypass_role_ids.isdisjoint(before_role_ids)
+        has_bypass_now = not bypass_role_ids.isdisjoint(after_role_ids)
         if had_bypass_before or not has_bypass_now:
             return
 
@@ -2924,11 +3356,34 @@ class Applications(commands.Cog):
                 after.display_name,
             )
 
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Drop cached settings and applications for a guild the bot left."""
+        for cache in (
+            self._guild_cache,
+            self._manager_role_ids,
+            self._bypass_role_ids,
+            self._cleanup_deltas,
+            self._access_roles,
+            self._apps_cache,
+            self._app_status,
+            self._pending_ids,
+            self._interview_channels,
+            self._cleanup_due,
+            self._embed_colors,
+            self._lobby_panel_checks,
+        ):
+            cache.pop(guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Re-resolve access roles next time; Role objects are otherwise updated in place."""
+        self._access_roles.pop(role.guild.id, None)
+
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
         """Clean up when member leaves."""
-        applications = await self.config.guild(member.guild).applications()
-        if str(member.id) not in applications:
+        if await self.get_application(member.guild, member.id) is None:
             return
 
         guild_id = member.guild.id
@@ -2942,9 +3397,7 @@ class Applications(commands.Cog):
                 del self.timer_tasks[guild_id]
 
         # Remove from applications
-        async with self.config.guild(member.guild).applications() as apps:
-            if str(member.id) in apps:
-                del apps[str(member.id)]
+        await self._delete_application(member.guild, member.id)
 
     @commands.group(name="applications", aliases=["app"])
     @commands.admin_or_permissions(manage_guild=True)
@@ -2961,11 +3414,11 @@ class Applications(commands.Cog):
         - Omit value to invert current state
         """
         if on_off is None:
-            current = await self.config.guild(ctx.guild).enabled()
-            await self.config.guild(ctx.guild).enabled.set(not current)
+            current = (await self._get_settings(ctx.guild))["enabled"]
+            await self._set_setting(ctx.guild, "enabled", not current)
             state = "enabled" if not current else "disabled"
         else:
-            await self.config.guild(ctx.guild).enabled.set(on_off)
+            await self._set_setting(ctx.guild, "enabled", on_off)
             state = "enabled" if on_off else "disabled"
 
         await ctx.send(f"Application system is now {state}.")
@@ -3021,15 +3474,50 @@ class Applications(commands.Cog):
         Omit `role` to clear the configured restricted role.
         """
         if role is None:
-            await self.config.guild(ctx.guild).restricted_role.set(None)
+            await self._set_setting(ctx.guild, "restricted_role", None)
             await ctx.send("Restricted role cleared.")
         else:
-            await self.config.guild(ctx.guild).restricted_role.set(role.id)
+            await self._set_setting(ctx.guild, "restricted_role", role.id)
             await ctx.send(
                 f"Restricted role set to {role.mention}. "
                 f"Make sure this role denies view permissions for restricted channels until approval."
             )
 
+    async def _mutate_role_list(
+        self,
+        ctx: commands.Context,
+        action: str,
+        role: Optional[discord.Role],
+        key: str,
+        singular: str,
+        plural: str,
+    ):
+        """Shared body of the bypass/access/manager role commands: add or remove one role ID in a list setting."""
+        action = action.lower()
+        if action not in ("add", "remove"):
+            await ctx.send("Invalid action. Use `add` or `remove`.")
+            return
+
+        if role is None:
+            await ctx.send("Please specify a role.")
+            return
+
+        # Check against the cached list first; Config is only written when the list actually changes
+        role_ids = (await self._get_settings(ctx.guild))[key]
+        changed = (role.id not in role_ids) if action == "add" else (role.id in role_ids)
+        if changed:
+            if action == "add":
+                new_ids = [*role_ids, role.id]
+            else:
+                new_ids = [rid for rid in role_ids if rid != role.id]
+            await self._set_setting(ctx.guild, key, new_ids)
+
+        if action == "add":
+            message = f"Added {role.mention} as {singular}." if changed else f"{role.mention} is already {singular}."
+        else:
+            message = f"Removed {role.mention} from {plural}." if changed else f"{role.mention} is not {singular}."
+        await ctx.send(message)
+
     @_role.command(name="bypass")
     async def _bypass_role(
         self, ctx: commands.Context, action: str, role: Optional[discord.Role] = None
@@ -3040,27 +3528,7 @@ class Applications(commands.Cog):
         Available actions: `add`, `remove`.
         Usage: `[p]applications role bypass <add|remove> @Role`
         """
-        if action.lower() not in ["add", "remove"]:
-            await ctx.send("Invalid action. Use `add` or `remove`.")
-            return
-
-        if role is None:
-            await ctx.send("Please specify a role.")
-            return
-
-        async with self.config.guild(ctx.guild).bypass_roles() as bypass_roles:
-            if action.lower() == "add":
-                if role.id not in bypass_roles:
-                    bypass_roles.append(role.id)
-                    await ctx.send(f"Added {role.mention} as a bypass role.")
-                else:
-                    await ctx.send(f"{role.mention} is already a bypass role.")
-            else:  # remove
-                if role.id in bypass_roles:
-                    bypass_roles.remove(role.id)
-                    await ctx.send(f"Removed {role.mention} from bypass roles.")
-                else:
-                    await ctx.send(f"{role.mention} is not a bypass role.")
+        await self._mutate_role_list(ctx, action, role, "bypass_roles", "a bypass role", "bypass roles")
 
     @_role.command(name="access")
     async def _access_role(
@@ -3074,27 +3542,7 @@ class Applications(commands.Cog):
         Available actions: `add`, `remove`.
         Usage: `[p]applications role access <add|remove> @Role`
         """
-        if action.lower() not in ["add", "remove"]:
-            await ctx.send("Invalid action. Use `add` or `remove`.")
-            return
-
-        if role is None:
-            await ctx.send("Please specify a role.")
-            return
-
-        async with self.config.guild(ctx.guild).access_roles() as access_roles:
-            if action.lower() == "add":
-                if role.id not in access_roles:
-                    access_roles.append(role.id)
-                    await ctx.send(f"Added {role.mention} as an access role.")
-                else:
-                    await ctx.send(f"{role.mention} is already an access role.")
-            else:  # remove
-                if role.id in access_roles:
-                    access_roles.remove(role.id)
-                    await ctx.send(f"Removed {role.mention} from access roles.")
-                else:
-                    await ctx.send(f"{role.mention} is not an access role.")
+        await self._mutate_role_list(ctx, action, role, "access_roles", "an access role", "access roles")
 
     @_role.command(name="manager")
     async def _manager_role(
@@ -3106,27 +3554,7 @@ class Applications(commands.Cog):
         Available actions: `add`, `remove`.
         Usage: `[p]applications role manager <add|remove> @Role`
         """
-        if action.lower() not in ["add", "remove"]:
-            await ctx.send("Invalid action. Use `add` or `remove`.")
-            return
-
-        if role is None:
-            await ctx.send("Please specify a role.")
-            return
-
-        async with self.config.guild(ctx.guild).manager_roles() as manager_roles:
-            if action.lower() == "add":
-                if role.id not in manager_roles:
-                    manager_roles.append(role.id)
-                    await ctx.send(f"Added {role.mention} as a manager role.")
-                else:
-                    await ctx.send(f"{role.mention} is already a manager role.")
-            else:  # remove
-                if role.id in manager_roles:
-                    manager_roles.remove(role.id)
-                    await ctx.send(f"Removed {role.mention} from manager roles.")
-                else:
-                    await ctx.send(f"{role.mention} is not a manager role.")
+        await self._mutate_role_list(ctx, action, role, "manager_roles", "a manager role", "manager roles")
 
     @_channel.command(name="log")
     async def _set_log_channel(
@@ -3137,10 +3565,10 @@ class Applications(commands.Cog):
         Provide `#channel` to set it, or omit to clear.
         """
         if channel is None:
-            await self.config.guild(ctx.guild).log_channel.set(None)
+            await self._set_setting(ctx.guild, "log_channel", None)
             await ctx.send("Log channel cleared.")
         else:
-            await self.config.guild(ctx.guild).log_channel.set(channel.id)
+            await self._set_setting(ctx.guild, "log_channel", channel.id)
             await ctx.send(f"Application events will be logged to {channel.mention}.")
 
     @_channel.command(name="lobby")
@@ -3152,11 +3580,10 @@ class Applications(commands.Cog):
         Provide `#channel` to set it, or omit to clear.
         """
         if channel is None:
-            await self.config.guild(ctx.guild).lobby_channel_id.set(None)
-            await self.config.guild(ctx.guild).lobby_panel_message_id.set(None)
+            await self._set_settings(ctx.guild, {"lobby_channel_id": None, "lobby_panel_message_id": None})
             await ctx.send("Lobby channel cleared.")
         else:
-            await self.config.guild(ctx.guild).lobby_channel_id.set(channel.id)
+            await self._set_setting(ctx.guild, "lobby_channel_id", channel.id)
             await ctx.send(
                 f"Lobby channel set to {channel.mention}. "
                 f"Use `{ctx.clean_prefix}applications lobby send` to send or refresh the panel there."
@@ -3171,19 +3598,20 @@ class Applications(commands.Cog):
         Provide `#channel` to set it, or omit to clear.
         """
         if channel is None:
-            await self.config.guild(ctx.guild).review_channel_id.set(None)
+            await self._set_setting(ctx.guild, "review_channel_id", None)
             await ctx.send("Review channel cleared.")
         else:
-            await self.config.guild(ctx.guild).review_channel_id.set(channel.id)
+            await self._set_setting(ctx.guild, "review_channel_id", channel.id)
             await ctx.send(f"New applications will be posted to {channel.mention}.")
 
     @_lobby.command(name="embed")
     async def _lobby_embed(self, ctx: commands.Context):
         """Open the embed builder to configure the lobby panel message (title, description, color, footer)."""
-        if not await self.config.guild(ctx.guild).enabled():
+        settings = await self._get_settings(ctx.guild)
+        if not settings["enabled"]:
             await ctx.send("Enable the application system first with `[p]applications toggle true`.")
             return
-        existing = await self.config.guild(ctx.guild).lobby_embed()
+        existing = settings["lobby_embed"]
         if existing is None:
             existing = {}
         self._lobby_embed_builder_states[ctx.author.id] = {"embed_data": existing}
@@ -3191,7 +3619,7 @@ class Applications(commands.Cog):
         embed = discord.Embed(
             title="Lobby Panel Embed Builder",
             description="Use the buttons below to configure, preview, or save the embed shown in the lobby.",
-            color=await ctx.embed_color(),
+            color=await self._embed_color(ctx.channel),
         )
         if existing and existing.get("title"):
             embed.add_field(name="Current title", value=existing.get("title", "Not set")[:1024], inline=False)
@@ -3201,10 +3629,11 @@ class Applications(commands.Cog):
     @_lobby.command(name="send")
     async def _send_panel(self, ctx: commands.Context):
         """Send or refresh the lobby panel (embed + Apply button) in the configured lobby channel."""
-        if not await self.config.guild(ctx.guild).enabled():
+        settings = await self._get_settings(ctx.guild)
+        if not settings["enabled"]:
             await ctx.send("Enable the application system first with `[p]applications toggle true`.")
             return
-        lobby_channel_id = await self.config.guild(ctx.guild).lobby_channel_id()
+        lobby_channel_id = settings["lobby_channel_id"]
         if not lobby_channel_id:
             await ctx.send(
                 "Set a lobby channel first with `[p]applications channel lobby #channel`. "
@@ -3215,17 +3644,16 @@ class Applications(commands.Cog):
         if not channel or not isinstance(channel, discord.TextChannel):
             await ctx.send("Lobby channel not found.")
             return
-        panel_message_id = await self.config.guild(ctx.guild).lobby_panel_message_id()
+        panel_message_id = settings["lobby_panel_message_id"]
         if panel_message_id:
             try:
-                old_msg = await channel.fetch_message(panel_message_id)
-                if old_msg and old_msg.author == self.bot.user:
-                    await old_msg.delete()
+                # The stored ID only ever comes from our own panel send, so delete it without fetching first
+                await channel.get_partial_message(panel_message_id).delete()
             except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                 pass
         msg = await self.send_lobby_panel(channel)
         if msg:
-            await self.config.guild(ctx.guild).lobby_panel_message_id.set(msg.id)
+            await self._set_setting(ctx.guild, "lobby_panel_message_id", msg.id)
             await ctx.send(f"Panel sent to {channel.mention}.")
         else:
             await ctx.send("Failed to send the panel. Check bot permissions.")
@@ -3239,10 +3667,10 @@ class Applications(commands.Cog):
         Provide `@Role` to set it, or omit to clear.
         """
         if role is None:
-            await self.config.guild(ctx.guild).notification_role.set(None)
+            await self._set_setting(ctx.guild, "notification_role", None)
             await ctx.send("Notification role cleared.")
         else:
-            await self.config.guild(ctx.guild).notification_role.set(role.id)
+            await self._set_setting(ctx.guild, "notification_role", role.id)
             await ctx.send(
                 f"Notification role set to {role.mention}. "
                 f"This role will be pinged when new applications are submitted."
@@ -3259,7 +3687,7 @@ class Applications(commands.Cog):
             await ctx.send("Delay must be a positive number.")
             return
 
-        await self.config.guild(ctx.guild).cleanup_delay.set(hours)
+        await self._set_setting(ctx.guild, "cleanup_delay", hours)
         await ctx.send(
             f"Cleanup delay set to {hours} hour(s). "
             f"Resolved application artifacts will be cleaned up {hours} hour(s) after approval or denial."
@@ -3277,7 +3705,7 @@ class Applications(commands.Cog):
         Setting a duration below 1 hour will prompt for confirmation.
         """
         if amount is None or unit is None:
-            current = await self.config.guild(ctx.guild).kick_timeout_seconds()
+            current = (await self._get_settings(ctx.guild))["kick_timeout_seconds"]
             if current is None:
                 current = 86400
             await ctx.send(
@@ -3328,7 +3756,7 @@ class Applications(commands.Cog):
                         "Only the person who ran the command can confirm.", ephemeral=True
                     )
                     return
-                await self.config.guild(ctx.guild).kick_timeout_seconds.set(total_seconds)
+                await self._set_setting(ctx.guild, "kick_timeout_seconds", total_seconds)
                 await interaction.response.send_message(
                     f"Kick timeout set to {duration_text}.", ephemeral=True
                 )
@@ -3348,7 +3776,7 @@ class Applications(commands.Cog):
             await ctx.send(embed=embed, view=view)
             return
 
-        await self.config.guild(ctx.guild).kick_timeout_seconds.set(total_seconds)
+        await self._set_setting(ctx.guild, "kick_timeout_seconds", total_seconds)
         await ctx.send(f"Kick timeout set to {duration_text}.")
 
     @_policy.command(name="rejoininvite")
@@ -3363,7 +3791,7 @@ class Applications(commands.Cog):
         - Omit value to clear the configured invite
         """
         if invite_url is None:
-            await self.config.guild(ctx.guild).rejoin_invite.set(None)
+            await self._set_setting(ctx.guild, "rejoin_invite", None)
             await ctx.send("Rejoin invite link cleared.")
             return
         
@@ -3381,7 +3809,7 @@ class Applications(commands.Cog):
                 )
                 return
         
-        await self.config.guild(ctx.guild).rejoin_invite.set(invite_url)
+        await self._set_setting(ctx.guild, "rejoin_invite", invite_url)
         await ctx.send(f"Rejoin invite link set to: {invite_url}")
 
     _DENIAL_ACTION_CHOICES = ("none", "kick", "tempban", "ban")
@@ -3396,10 +3824,10 @@ class Applications(commands.Cog):
         If no action is given, shows the current setting.
         """
         if action is None:
-            current_raw = await self.config.guild(ctx.guild).denial_action()
+            current_raw = (await self._get_settings(ctx.guild))["denial_action"]
             current = self._normalize_member_action(current_raw, allow_none=True)
             if current_raw != current:
-                await self.config.guild(ctx.guild).denial_action.set(current)
+                await self._set_setting(ctx.guild, "denial_action", current)
             await ctx.send(
                 f"Denial action is set to: **{current}**.\n"
                 f"Available options: **{', '.join(self._DENIAL_ACTION_CHOICES)}**."
@@ -3411,7 +3839,7 @@ class Applications(commands.Cog):
                 f"❌ Invalid action. Use one of: {', '.join(self._DENIAL_ACTION_CHOICES)}."
             )
             return
-        await self.config.guild(ctx.guild).denial_action.set(a)
+        await self._set_setting(ctx.guild, "denial_action", a)
         await ctx.send(f"Denial action set to: **{a}**.")
 
     @_policy_denial.command(name="dm")
@@ -3425,13 +3853,13 @@ class Applications(commands.Cog):
         - Omit value to show current setting
         """
         if on_off is None:
-            current = await self.config.guild(ctx.guild).denial_send_dm()
+            current = (await self._get_settings(ctx.guild))["denial_send_dm"]
             await ctx.send(
                 f"Send DM before denial removal: **{'Yes' if current else 'No'}**.\n"
                 "Available options: **true** or **false**."
             )
             return
-        await self.config.guild(ctx.guild).denial_send_dm.set(on_off)
+        await self._set_setting(ctx.guild, "denial_send_dm", on_off)
         await ctx.send(f"Send DM before denial removal: **{'Yes' if on_off else 'No'}**.")
 
     @_policy_approval.command(name="dm")
@@ -3445,13 +3873,13 @@ class Applications(commands.Cog):
         - Omit value to show current setting
         """
         if on_off is None:
-            current = await self.config.guild(ctx.guild).approval_send_dm()
+            current = (await self._get_settings(ctx.guild))["approval_send_dm"]
             await ctx.send(
                 f"Send DM on approval: **{'Yes' if current else 'No'}**.\n"
                 "Available options: **true** or **false**."
             )
             return
-        await self.config.guild(ctx.guild).approval_send_dm.set(on_off)
+        await self._set_setting(ctx.guild, "approval_send_dm", on_off)
         await ctx.send(f"Send DM on approval: **{'Yes' if on_off else 'No'}**.")
 
     @_policy_denial.command(name="tempbanduration")
@@ -3468,7 +3896,7 @@ class Applications(commands.Cog):
         If omitted, shows current duration.
         """
         if amount is None or unit is None:
-            current = await self.config.guild(ctx.guild).denial_tempban_duration_seconds()
+            current = (await self._get_settings(ctx.guild))["denial_tempban_duration_seconds"]
             if current is None:
                 current = 86400
             await ctx.send(
@@ -3493,7 +3921,7 @@ class Applications(commands.Cog):
             return
         total_seconds = int(amount * unit_map[u])
         total_seconds = max(self.TEMPBAN_MIN_SECONDS, min(self.TEMPBAN_MAX_SECONDS, total_seconds))
-        await self.config.guild(ctx.guild).denial_tempban_duration_seconds.set(total_seconds)
+        await self._set_setting(ctx.guild, "denial_tempban_duration_seconds", total_seconds)
         await ctx.send(f"Denial tempban duration set to: {self._format_timeout(total_seconds)}.")
 
     @_policy_early_close.command(name="action")
@@ -3505,10 +3933,10 @@ class Applications(commands.Cog):
         If no action is given, shows the current setting.
         """
         if action is None:
-            current_raw = await self.config.guild(ctx.guild).early_close_action()
+            current_raw = (await self._get_settings(ctx.guild))["early_close_action"]
             current = self._normalize_member_action(current_raw)
             if current_raw != current:
-                await self.config.guild(ctx.guild).early_close_action.set(current)
+                await self._set_setting(ctx.guild, "early_close_action", current)
             await ctx.send(
                 f"Early close action is set to: **{current}**.\n"
                 f"Available options: **{', '.join(self._EARLY_CLOSE_ACTION_CHOICES)}**."
@@ -3520,7 +3948,7 @@ class Applications(commands.Cog):
                 f"❌ Invalid action. Use one of: {', '.join(self._EARLY_CLOSE_ACTION_CHOICES)}."
             )
             return
-        await self.config.guild(ctx.guild).early_close_action.set(a)
+        await self._set_setting(ctx.guild, "early_close_action", a)
         await ctx.send(f"Early close action set to: **{a}**.")
 
     @_policy_early_close.command(name="dm")
@@ -3534,13 +3962,13 @@ class Applications(commands.Cog):
         - Omit value to show current setting
         """
         if on_off is None:
-            current = await self.config.guild(ctx.guild).early_close_send_dm()
+            current = (await self._get_settings(ctx.guild))["early_close_send_dm"]
             await ctx.send(
                 f"Send DM before early-close removal: **{'Yes' if current else 'No'}**.\n"
                 "Available options: **true** or **false**."
             )
             return
-        await self.config.guild(ctx.guild).early_close_send_dm.set(on_off)
+        await self._set_setting(ctx.guild, "early_close_send_dm", on_off)
         await ctx.send(f"Send DM before early-close removal: **{'Yes' if on_off else 'No'}**.")
 
     @_policy_early_close.command(name="tempbanduration")
@@ -3557,7 +3985,7 @@ class Applications(commands.Cog):
         If omitted, shows current duration.
         """
         if amount is None or unit is None:
-            current = await self.config.guild(ctx.guild).early_close_tempban_duration_seconds()
+            current = (await self._get_settings(ctx.guild))["early_close_tempban_duration_seconds"]
             if current is None:
                 current = 86400
             await ctx.send(
@@ -3582,7 +4010,7 @@ class Applications(commands.Cog):
             return
         total_seconds = int(amount * unit_map[u])
         total_seconds = max(self.TEMPBAN_MIN_SECONDS, min(self.TEMPBAN_MAX_SECONDS, total_seconds))
-        await self.config.guild(ctx.guild).early_close_tempban_duration_seconds.set(total_seconds)
+        await self._set_setting(ctx.guild, "early_close_tempban_duration_seconds", total_seconds)
         await ctx.send(f"Early close tempban duration set to: {self._format_timeout(total_seconds)}.")
 
     @_applications.command(name="setup", aliases=["serversetup"])
@@ -3602,7 +4030,7 @@ class Applications(commands.Cog):
                 "On approval, the role is removed.\n\n"
                 "**Access roles:** New members have no special role. On approval, they receive roles that grant access."
             ),
-            color=await ctx.embed_color(),
+            color=await self._embed_color(ctx.channel),
             timestamp=discord.utils.utcnow(),
         )
         embed.set_footer(text="Click a button below. Setup can be run anytime; you can use existing channels or create new ones.")
@@ -3615,13 +4043,13 @@ class Applications(commands.Cog):
 
         No options. Includes an Auto-fix button for fixable issues.
         """
-        if not await self.config.guild(ctx.guild).enabled():
+        if not (await self._get_settings(ctx.guild))["enabled"]:
             await ctx.send("Enable the application system first with `[p]applications toggle true`.")
             return
         results = await self._run_config_checks(ctx.guild)
         embed = discord.Embed(
             title="Application System Check",
-            color=await ctx.embed_color(),
+            color=await self._embed_color(ctx.channel),
             timestamp=discord.utils.utcnow(),
         )
         fixable = []
@@ -3654,20 +4082,20 @@ class Applications(commands.Cog):
                         await interaction.response.send_message("Only the command author can run auto-fix.", ephemeral=True)
                         return
                     await interaction.response.defer(ephemeral=True)
-                    guild_config = self.cog.config.guild(self.guild)
                     for r in self.fixable_list:
                         name = r["name"]
                         if name == "Lobby channel":
-                            await guild_config.lobby_channel_id.set(None)
-                            await guild_config.lobby_panel_message_id.set(None)
+                            await self.cog._set_settings(
+                                self.guild, {"lobby_channel_id": None, "lobby_panel_message_id": None}
+                            )
                         elif name == "Review channel":
-                            await guild_config.review_channel_id.set(None)
+                            await self.cog._set_setting(self.guild, "review_channel_id", None)
                         elif name == "Log channel":
-                            await guild_config.log_channel.set(None)
+                            await self.cog._set_setting(self.guild, "log_channel", None)
                         elif name == "Lobby panel message":
                             await self.cog.ensure_lobby_panel(self.guild)
                         elif name == "Manager roles":
-                            await guild_config.manager_roles.set([])
+                            await self.cog._set_setting(self.guild, "manager_roles", [])
                     await interaction.followup.send(
                         "Auto-fix applied. Run the check command again to verify.",
                         ephemeral=True,
@@ -3700,9 +4128,9 @@ class Applications(commands.Cog):
         - `[p]applications maintenance debug @user` enables bypass for one user
         - `[p]applications maintenance debug off` disables bypass
         """
-        g = self.config.guild(ctx.guild)
-        current_enabled = await g.debug_bypass_enabled()
-        current_user_id = await g.debug_bypass_user_id()
+        settings = await self._get_settings(ctx.guild)
+        current_enabled = settings["debug_bypass_enabled"]
+        current_user_id = settings["debug_bypass_user_id"]
         current_member = ctx.guild.get_member(int(current_user_id)) if current_user_id else None
 
         # No args: show current status
@@ -3716,8 +4144,7 @@ class Applications(commands.Cog):
 
         normalized = member_or_flag.strip().lower()
         if normalized in {"off", "disable", "disabled", "false", "0", "clear", "none"}:
-            await g.debug_bypass_enabled.set(False)
-            await g.debug_bypass_user_id.set(None)
+            await self._set_settings(ctx.guild, {"debug_bypass_enabled": False, "debug_bypass_user_id": None})
             await ctx.send("Debug bypass disabled.")
             return
 
@@ -3730,8 +4157,7 @@ class Applications(commands.Cog):
             )
             return
 
-        await g.debug_bypass_user_id.set(member.id)
-        await g.debug_bypass_enabled.set(True)
+        await self._set_settings(ctx.guild, {"debug_bypass_user_id": member.id, "debug_bypass_enabled": True})
         await ctx.send(
             "Debug bypass enabled for "
             f"{member.mention}. This user can re-submit applications for testing."
@@ -3743,7 +4169,7 @@ class Applications(commands.Cog):
 
         No options. Scans guild members and reports a summary.
         """
-        bypass_role_ids = await self.config.guild(ctx.guild).bypass_roles()
+        bypass_role_ids = (await self._get_settings(ctx.guild))["bypass_roles"]
         if not bypass_role_ids:
             await ctx.send(
                 "No bypass roles are configured. Add one with "
@@ -3768,13 +4194,12 @@ class Applications(commands.Cog):
 
         await ctx.send("Backfilling access roles for bypass members...")
 
-        bypass_role_id_set = set(bypass_role_ids)
+        bypass_role_id_set = frozenset(bypass_role_ids)
         for member in ctx.guild.members:
             if member.bot:
                 continue
             scanned += 1
-            member_role_ids = {role.id for role in member.roles}
-            if not any(role_id in member_role_ids for role_id in bypass_role_id_set):
+            if not any(member.get_role(role_id) is not None for role_id in bypass_role_id_set):
                 continue
 
             eligible += 1
@@ -3839,12 +4264,13 @@ class Applications(commands.Cog):
         Example: [p]applications field add age "What is your age?" text True "e.g. 25"
         """
         field_type_lower = field_type.lower()
-        if field_type_lower not in ["text", "paragraph", "number", "confirm"]:
+        if field_type_lower not in _VALID_FIELD_TYPES:
             await ctx.send("Invalid field type. Use `text`, `paragraph`, `number`, or `confirm`.")
             return
 
         # Confirm type: 5th arg is confirm text. Otherwise 5th can be placeholder, 6th is placeholder when 5th is confirm text.
-        confirm_text = ""
+        field_data = {"name": name, "label": label, "type": field_type_lower, "required": required}
+        confirm_msg = ""
         if field_type_lower == "confirm":
             if not confirm_or_placeholder:
                 await ctx.send(
@@ -3856,49 +4282,99 @@ class Applications(commands.Cog):
             if not confirm_text:
                 await ctx.send("Confirmation text cannot be empty.")
                 return
-            placeholder_val = (placeholder or "").strip()[:100]
+            field_data["placeholder"] = (placeholder or "").strip()[:100]
+            field_data["confirm_text"] = confirm_text
+            confirm_msg = f" requiring confirmation: `{confirm_text}`"
         else:
             # For non-confirm, 5th arg is placeholder if provided
-            placeholder_val = (confirm_or_placeholder or placeholder or "").strip()[:100]
+            field_data["placeholder"] = (confirm_or_placeholder or placeholder or "").strip()[:100]
 
-        async with self.config.guild(ctx.guild).form_fields() as fields:
+        async with self._edit_form_fields(ctx.guild) as fields:
             if len(fields) >= MAX_FORM_FIELDS:
                 await ctx.send(
                     f"Forms may contain at most {MAX_FORM_FIELDS} fields (Discord limit). Remove a field first."
                 )
                 return
-            if any(f.get("name") == name for f in fields):
+            if name in self._fields_by_name[ctx.guild.id]:
                 await ctx.send(f"A field with name `{name}` already exists.")
                 return
 
-            field_data = {
-                "name": name,
-                "label": label,
-                "type": field_type_lower,
-                "required": required,
-                "placeholder": placeholder_val,
-            }
-            if field_type_lower == "confirm":
-                field_data["confirm_text"] = confirm_text
-
             fields.append(field_data)
 
-        confirm_msg = f" requiring confirmation: `{confirm_text}`" if confirm_text else ""
         await ctx.send(f"Added field `{name}` ({field_type_lower}){confirm_msg} to the application form.")
 
+    @_field.command(name="addmany")
+    async def _field_addmany(self, ctx: commands.Context, *, fields_json: str):
+        """Add several form fields at once from a JSON list.
+
+        Each item takes `name`, `label`, `type` (default `text`), `required` (default true) and either
+        `placeholder` or, for confirm fields, `confirm_text`. Nothing is added if any item is invalid.
+        Example: [p]applications field addmany [{"name": "age", "label": "What is your age?", "type": "number"}]
+        """
+        blob = fields_json.strip()
+        if blob.startswith("```"):
+            blob = blob.strip("`")
+            if blob.startswith("json"):
+                blob = blob[4:]
+        try:
+            items = json.loads(blob)
+        except ValueError as e:
+            await ctx.send(f"Could not parse the field list as JSON: {e}")
+            return
+        if not isinstance(items, list) or not items or not all(isinstance(item, dict) for item in items):
+            await ctx.send("Provide a non-empty JSON list of field objects.")
+            return
+
+        async with self._edit_form_fields(ctx.guild) as fields:
+            if len(fields) + len(items) > MAX_FORM_FIELDS:
+                await ctx.send(
+                    f"Forms may contain at most {MAX_FORM_FIELDS} fields (Discord limit); "
+                    f"this form has {len(fields)}. Remove fields or add fewer."
+                )
+                return
+
+            new_fields = []
+            seen = set(self._fields_by_name[ctx.guild.id])
+            for i, item in enumerate(items, 1):
+                if not item.get("name") or not item.get("label"):
+                    await ctx.send(f"Field {i}: `name` and `label` are required. Nothing was added.")
+                    return
+                field_type = str(item.get("type") or "text")
+                extra = item.get("confirm_text") if field_type.lower() == "confirm" else item.get("placeholder")
+                field_data, error = _parse_field_inputs(
+                    str(item["name"]),
+                    str(item["label"]),
+                    field_type,
+                    str(item.get("required", True)),
+                    str(extra) if extra is not None else None,
+                )
+                if error:
+                    await ctx.send(f"Field {i}: {error} Nothing was added.")
+                    return
+                if field_data["name"] in seen:
+                    await ctx.send(f"Field {i}: a field named `{field_data['name']}` already exists. Nothing was added.")
+                    return
+                seen.add(field_data["name"])
+                new_fields.append(field_data)
+
+            fields.extend(new_fields)
+
+        added = ", ".join(f"`{f['name']}`" for f in new_fields)
+        await ctx.send(f"Added {len(new_fields)} field(s) to the application form: {added}")
+
     @_field.command(name="remove")
     async def _field_remove(self, ctx: commands.Context, name: str):
         """Remove a form field by field name.
 
         Usage: `[p]applications field remove <name>`
         """
-        async with self.config.guild(ctx.guild).form_fields() as fields:
-            field_names = [f.get("name") for f in fields]
-            if name not in field_names:
+        async with self._edit_form_fields(ctx.guild) as fields:
+            field_index = self._fields_by_name[ctx.guild.id].get(name)
+            if field_index is None:
                 await ctx.send(f"Field `{name}` not found.")
                 return
 
-            fields[:] = [f for f in fields if f.get("name") != name]
+            del fields[field_index]
 
         await ctx.send(f"Removed field `{name}` from the application form.")
 
@@ -3908,14 +4384,14 @@ class Applications(commands.Cog):
 
         No options.
         """
-        fields = await self.config.guild(ctx.guild).form_fields()
+        fields = await self.get_form_fields(ctx.guild)
         if not fields:
             await ctx.send("No form fields configured.")
             return
 
         embed = discord.Embed(
             title="Application Form Fields",
-            color=await ctx.embed_color(),
+            color=await self._embed_color(ctx.channel),
         )
 
         for i, field in enumerate(fields, 1):
@@ -3944,7 +4420,7 @@ class Applications(commands.Cog):
 
         No options. Opens the real modal, but submitting does not save data.
         """
-        fields = await self.config.guild(ctx.guild).form_fields()
+        fields = await self.get_form_fields(ctx.guild)
         if not fields:
             await ctx.send(
                 "No application form configured. Add fields with `{0}applications field add` or use the field manager: `{0}applications field manager`.".format(
@@ -3964,17 +4440,14 @@ class Applications(commands.Cog):
         
         Example: [p]applications field confirmtext agreement "I agree"
         """
-        async with self.config.guild(ctx.guild).form_fields() as fields:
-            field = None
-            for f in fields:
-                if f.get("name") == name:
-                    field = f
-                    break
-
-            if not field:
+        async with self._edit_form_fields(ctx.guild) as fields:
+            field_index = self._fields_by_name[ctx.guild.id].get(name)
+            if field_index is None:
                 await ctx.send(f"Field `{name}` not found.")
                 return
 
+            field = fields[field_index]
+
             if field.get("type") != "confirm":
                 await ctx.send(f"Field `{name}` is not a confirm field. Only confirm fields can have confirmation text.")
                 return
@@ -3995,39 +4468,7 @@ class Applications(commands.Cog):
         """
         view = FieldManagerView(self)
         
-        # Create initial embed
-        fields = await self.config.guild(ctx.guild).form_fields()
-        embed = discord.Embed(
-            title="📋 Application Form Fields Manager",
-            description="Use the buttons below to manage your application form fields. **Forms may contain at most 5 fields** (Discord limit).",
-            color=await ctx.embed_color(),
-        )
-
-        if not fields:
-            embed.add_field(
-                name="No Fields",
-                value="Add your first field using the **Add Field** button below.",
-                inline=False,
-            )
-        else:
-            for i, field in enumerate(fields, 1):
-                field_type = field.get("type", "text")
-                required = field.get("required", True)
-                placeholder = field.get("placeholder", "")
-                confirm_text = field.get("confirm_text", "")
-
-                value_text = f"**Type:** {field_type}\n**Required:** {'Yes' if required else 'No'}"
-                if placeholder:
-                    value_text += f"\n**Placeholder:** {placeholder}"
-                if confirm_text:
-                    value_text += f"\n**Must type:** `{confirm_text}`"
-
-                embed.add_field(
-                    name=f"{i}. {field.get('label', field.get('name'))}",
-                    value=value_text,
-                    inline=False,
-                )
-
+        embed = await self._get_field_manager_embed(ctx.channel)
         view.message = await ctx.send(embed=embed, view=view)
 
     @_applications.command(name="settings")
@@ -4036,59 +4477,56 @@ class Applications(commands.Cog):
 
         No options.
         """
-        g = self.config.guild(ctx.guild)
-        restricted_role_id = await g.restricted_role()
+        settings = await self._get_settings(ctx.guild)
+        restricted_role_id = settings["restricted_role"]
         restricted_role = (
             ctx.guild.get_role(restricted_role_id) if restricted_role_id else None
         )
 
-        access_role_ids = await g.access_roles() or []
+        access_role_ids = settings["access_roles"] or []
         access_roles = [
-            ctx.guild.get_role(rid) for rid in access_role_ids if ctx.guild.get_role(rid)
+            role for rid in access_role_ids if (role := ctx.guild.get_role(rid))
         ]
 
-        bypass_role_ids = await g.bypass_roles() or []
+        bypass_role_ids = settings["bypass_roles"] or []
         bypass_roles = [
-            ctx.guild.get_role(rid) for rid in bypass_role_ids if ctx.guild.get_role(rid)
+            role for rid in bypass_role_ids if (role := ctx.guild.get_role(rid))
         ]
 
-        log_channel_id = await g.log_channel()
+        log_channel_id = settings["log_channel"]
         log_channel = ctx.guild.get_channel(log_channel_id) if log_channel_id else None
 
-        notification_role_id = await g.notification_role()
+        notification_role_id = settings["notification_role"]
         notification_role = (
             ctx.guild.get_role(notification_role_id) if notification_role_id else None
         )
 
-        cleanup_delay = await g.cleanup_delay() or 24
-        kick_timeout_seconds = await g.kick_timeout_seconds() or 86400
-        rejoin_invite = await g.rejoin_invite()
-        denial_action = self._normalize_member_action(await g.denial_action(), allow_none=True)
-        denial_send_dm = await g.denial_send_dm()
-        denial_tempban_seconds = await g.denial_tempban_duration_seconds() or 86400
-        early_close_action = self._normalize_member_action(await g.early_close_action())
-        early_close_send_dm = await g.early_close_send_dm()
-        early_close_tempban_seconds = await g.early_close_tempban_duration_seconds() or 86400
-        approval_send_dm = await g.approval_send_dm()
-        debug_bypass_enabled = await g.debug_bypass_enabled()
-        debug_bypass_user_id = await g.debug_bypass_user_id()
-        pending_unbans = await g.pending_unbans() or []
-
-        form_fields = await g.form_fields() or []
-        applications_raw = await g.applications()
-        applications = applications_raw if isinstance(applications_raw, dict) else {}
-        pending_count = sum(
-            1 for app in applications.values() if isinstance(app, dict) and app.get("status") == "pending"
-        )
-
-        enabled = await g.enabled()
-        lobby_channel_id = await g.lobby_channel_id()
-        review_channel_id = await g.review_channel_id()
-        manager_role_ids = await g.manager_roles() or []
+        cleanup_delay = settings["cleanup_delay"] or 24
+        kick_timeout_seconds = settings["kick_timeout_seconds"] or 86400
+        rejoin_invite = settings["rejoin_invite"]
+        denial_action = self._normalize_member_action(settings["denial_action"], allow_none=True)
+        denial_send_dm = settings["denial_send_dm"]
+        denial_tempban_seconds = settings["denial_tempban_duration_seconds"] or 86400
+        early_close_action = self._normalize_member_action(settings["early_close_action"])
+        early_close_send_dm = settings["early_close_send_dm"]
+        early_close_tempban_seconds = settings["early_close_tempban_duration_seconds"] or 86400
+        approval_send_dm = settings["approval_send_dm"]
+        debug_bypass_enabled = settings["debug_bypass_enabled"]
+        debug_bypass_user_id = settings["debug_bypass_user_id"]
+        pending_unbans = settings["pending_unbans"] or []
+
+        form_fields = await self.get_form_fields(ctx.guild)
+        await self.get_applications(ctx.guild)
+        pending_count = len(self._pending_ids[ctx.guild.id])
+
+        enabled = settings["enabled"]
+        lobby_channel_id = settings["lobby_channel_id"]
+        review_channel_id = settings["review_channel_id"]
+        manager_role_ids = settings["manager_roles"] or []
 
         embed = discord.Embed(
             title="Application System Settings",
-            color=await ctx.embed_color(),
+            color=await self._embed_color(ctx.channel),
         )
 
         embed.add_field(
@@ -4102,8 +4540,7 @@ class Applications(commands.Cog):
         if restricted_role:
             role_system_info = f"**Restricted Role:** {restricted_role.mention}"
         elif access_roles:
-            access_list = ", ".join([r.mention for r in access_roles])
-            role_system_info = f"**Access Roles:** {access_list if len(access_list) <= 1024 else f'{len(access_roles)} roles'}"
+            role_system_info = f"**Access Roles:** {_role_mentions(access_roles)}"
         else:
             role_system_info = "**Role System:** Not configured"
         
@@ -4216,21 +4653,19 @@ class Applications(commands.Cog):
         )
 
         if bypass_roles:
-            bypass_list = ", ".join([r.mention for r in bypass_roles])
             embed.add_field(
                 name="Bypass Roles",
-                value=bypass_list if len(bypass_list) <= 1024 else f"{len(bypass_roles)} roles",
+                value=_role_mentions(bypass_roles),
                 inline=False,
             )
 
         manager_roles = [
-            ctx.guild.get_role(rid) for rid in manager_role_ids if ctx.guild.get_role(rid)
+            role for rid in manager_role_ids if (role := ctx.guild.get_role(rid))
         ]
         if manager_roles:
-            manager_list = ", ".join([r.mention for r in manager_roles])
             embed.add_field(
                 name="Manager Roles",
-                value=manager_list if len(manager_list) <= 1024 else f"{len(manager_roles)} roles",
+                value=_role_mentions(manager_roles),
                 inline=False,
             )
 
@@ -4255,12 +4690,14 @@ class Applications(commands.Cog):
 
         Returns a warning message string if a permission error occurred, else None.
         """
-        restricted_role_id = await self.config.guild(guild).restricted_role()
-        access_role_ids = await self.config.guild(guild).access_roles()
+        settings = await self._get_settings(guild)
+        restricted_role_id = settings["restricted_role"]
+        access_role_ids = settings["access_roles"]
 
         if restricted_role_id:
-            restricted_role = guild.get_role(restricted_role_id)
-            if restricted_role and restricted_role in member.roles:
+            # Member.get_role searches the member's role IDs; member.roles would build and sort a Role list
+            restricted_role = member.get_role(restricted_role_id)
+            if restricted_role:
                 try:
                     await member.remove_roles(restricted_role, reason="Application approved")
                     log.info("Removed restricted role from %s", member.display_name)
@@ -4298,75 +4735,51 @@ class Applications(commands.Cog):
         it will approve the matching applicant.
         Usage: `[p]applications approve [@member]`
         """
-        # If no member specified, try to find from current channel
-        if member is None:
-            applications = await self.config.guild(ctx.guild).applications()
-            current_channel_id = ctx.channel.id
-            
-            # Find application by interview channel ID
-            found_member = None
-            for user_id, app_data in applications.items():
-                if app_data.get("interview_channel_id") == current_channel_id:
-                    found_member = ctx.guild.get_member(int(user_id))
-                    if found_member:
-                        member = found_member
-                        break
-            
-            if not member:
-                await ctx.send(
-                    "❌ No member specified and this doesn't appear to be an interview channel. "
-                    "Please specify a member: `[p]applications approve @user`"
-                )
-                return
-
-        if not await self.config.guild(ctx.guild).enabled():
+        settings = await self._get_settings(ctx.guild)
+        if not settings["enabled"]:
             await ctx.send("The application system is not enabled.")
             return
 
-        applications = await self.config.guild(ctx.guild).applications()
-        if str(member.id) not in applications:
-            await ctx.send(f"{member.mention} does not have an active application.")
-            return
-
-        app_data = applications[str(member.id)]
-        if app_data.get("status") != "pending":
-            await ctx.send(
-                f"{member.mention}'s application is already {app_data.get('status')}."
-            )
+        member, app_data = await self._resolve_application(ctx, member, "approve @user")
+        if app_data is None:
             return
 
-        # Handle role changes on approval
-        warning = await self._apply_approval_roles(ctx.guild, member)
-        if warning:
-            await ctx.send(warning)
+        async with self._decision_lock(ctx.guild.id, member.id):
+            # Re-read under the lock; another moderator may have resolved it meanwhile
+            app_data = await self.get_application(ctx.guild, member.id) or app_data
+            if self._application_status(ctx.guild.id, member.id) is not AppStatus.PENDING:
+                await ctx.send(
+                    f"{member.mention}'s application is already {app_data.get('status')}."
+                )
+                return
 
-        # Update status
-        app_data["status"] = "approved"
-        app_data["approved_by"] = ctx.author.id
-        app_data["approved_at"] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-        
-        # Schedule cleanup
-        cleanup_delay = await self.config.guild(ctx.guild).cleanup_delay()
-        cleanup_time = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=cleanup_delay)
-        app_data["cleanup_scheduled_at"] = cleanup_time.isoformat()
-        
-        async with self.config.guild(ctx.guild).applications() as apps:
-            if str(member.id) in apps:
-                apps[str(member.id)].update(app_data)
-
-        # Log to log channel
-        decision_maker = ctx.guild.get_member(ctx.author.id)
-        await self.log_application_event(
-            ctx.guild, member, "approved", decision_maker=decision_maker
-        )
+            # Handle role changes on approval
+            warning = await self._apply_approval_roles(ctx.guild, member)
 
-        if await self.config.guild(ctx.guild).approval_send_dm():
-            await self._send_approval_dm(ctx.guild, member)
+            # Update status and schedule cleanup; only this member's record is rewritten
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            cleanup_at = now + await self._cleanup_delta(ctx.guild)
+            await self._update_application(ctx.guild, member.id, {
+                "status": "approved",
+                "approved_by": ctx.author.id,
+                "approved_at": now.isoformat(),
+                "cleanup_scheduled_at": cleanup_at.isoformat(),
+            })
 
-        # Update review channel message (new flow): remove buttons, show approved
-        await self._update_review_message_after_resolve(ctx.guild, app_data, member, "approved")
+        if warning:
+            await ctx.send(warning)
 
-        await ctx.send(f"✅ Approved {member.mention}'s application.")
+        # The decision is saved; the confirmation need not wait behind the log post, DM and review edit
+        followups = [
+            self.log_application_event(ctx.guild, member, "approved", decision_maker=ctx.author),
+            ctx.send(f"✅ Approved {member.mention}'s application."),
+            self._update_review_message_after_resolve(ctx.guild, app_data, member, "approved"),
+        ]
+        if settings["approval_send_dm"]:
+            followups.append(self._send_approval_dm(ctx.guild, member))
+        for result in await asyncio.gather(*followups, return_exceptions=True):
+            if isinstance(result, Exception):
+                log.error("Error finishing approval for %s in %s", member.id, ctx.guild.id, exc_info=result)
 
     @_applications.command(name="deny", aliases=["d"])
     async def _deny(
@@ -4378,90 +4791,64 @@ class Applications(commands.Cog):
         it will deny the matching applicant.
         Usage: `[p]applications deny [@member] [reason]`
         """
-        # If no member specified, try to find from current channel
-        if member is None:
-            applications = await self.config.guild(ctx.guild).applications()
-            current_channel_id = ctx.channel.id
-            
-            # Find application by interview channel ID
-            found_member = None
-            for user_id, app_data in applications.items():
-                if app_data.get("interview_channel_id") == current_channel_id:
-                    found_member = ctx.guild.get_member(int(user_id))
-                    if found_member:
-                        member = found_member
-                        break
-            
-            if not member:
-                await ctx.send(
-                    "❌ No member specified and this doesn't appear to be an interview channel. "
-                    "Please specify a member: `[p]applications deny @user [reason]`"
-                )
-                return
-
-        if not await self.config.guild(ctx.guild).enabled():
+        if not (await self._get_settings(ctx.guild))["enabled"]:
             await ctx.send("The application system is not enabled.")
             return
 
-        applications = await self.config.guild(ctx.guild).applications()
-        if str(member.id) not in applications:
-            await ctx.send(f"{member.mention} does not have an active application.")
+        member, app_data = await self._resolve_application(ctx, member, "deny @user [reason]")
+        if app_data is None:
             return
 
-        app_data = applications[str(member.id)]
-        if app_data.get("status") != "pending":
-            await ctx.send(
-                f"{member.mention}'s application is already {app_data.get('status')}."
-            )
-            return
+        async with self._decision_lock(ctx.guild.id, member.id):
+            # Re-read under the lock; another moderator may have resolved it meanwhile
+            app_data = await self.get_application(ctx.guild, member.id) or app_data
+            if self._application_status(ctx.guild.id, member.id) is not AppStatus.PENDING:
+                await ctx.send(
+                    f"{member.mention}'s application is already {app_data.get('status')}."
+                )
+                return
 
-        # Update status
-        app_data["status"] = "denied"
-        app_data["denied_by"] = ctx.author.id
-        app_data["denied_at"] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-        if reason:
-            app_data["denial_reason"] = reason
-        
-        # Schedule cleanup
-        cleanup_delay = await self.config.guild(ctx.guild).cleanup_delay()
-        cleanup_time = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=cleanup_delay)
-        app_data["cleanup_scheduled_at"] = cleanup_time.isoformat()
-        
-        async with self.config.guild(ctx.guild).applications() as apps:
-            if str(member.id) in apps:
-                apps[str(member.id)].update(app_data)
-
-        # Log to log channel
-        decision_maker = ctx.guild.get_member(ctx.author.id)
-        await self.log_application_event(
-            ctx.guild, member, "denied", decision_maker=decision_maker, reason=reason
-        )
+            # Update status and schedule cleanup; only this member's record is rewritten
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            cleanup_at = now + await self._cleanup_delta(ctx.guild)
+            changes = {
+                "status": "denied",
+                "denied_by": ctx.author.id,
+                "denied_at": now.isoformat(),
+                "cleanup_scheduled_at": cleanup_at.isoformat(),
+            }
+            if reason:
+                changes["denial_reason"] = reason
+            await self._update_application(ctx.guild, member.id, changes)
 
         # Execute configured denial action (DM before removal)
-        denial_action = self._normalize_member_action(
-            await self.config.guild(ctx.guild).denial_action(), allow_none=True
-        )
-        denial_send_dm = await self.config.guild(ctx.guild).denial_send_dm()
+        settings = await self._get_settings(ctx.guild)
+        denial_action = self._normalize_member_action(settings["denial_action"], allow_none=True)
+        denial_send_dm = settings["denial_send_dm"]
         denial_tempban_seconds = (
-            await self.config.guild(ctx.guild).denial_tempban_duration_seconds()
-            if denial_action == "tempban"
-            else None
+            settings["denial_tempban_duration_seconds"] if denial_action == "tempban" else None
         )
         action_reason = f"Application denied.{f' Reason: {reason}' if reason else ''}"
-        await self._execute_member_action(
-            ctx.guild,
-            member,
-            denial_action,
-            action_reason,
-            denial_send_dm,
-            tempban_seconds=denial_tempban_seconds,
-            context="denial",
-        )
-
-        # Update review channel message (new flow): remove buttons, show denied
-        await self._update_review_message_after_resolve(ctx.guild, app_data, member, "denied", reason=reason)
 
-        await ctx.send(f"❌ Denied {member.mention}'s application.")
+        # The decision is saved; the confirmation need not wait behind the log post, member action and review edit
+        results = await asyncio.gather(
+            self.log_application_event(ctx.guild, member, "denied", decision_maker=ctx.author, reason=reason),
+            self._execute_member_action(
+                ctx.guild,
+                member,
+                denial_action,
+                action_reason,
+                denial_send_dm,
+                tempban_seconds=denial_tempban_seconds,
+                context="denial",
+            ),
+            ctx.send(f"❌ Denied {member.mention}'s application."),
+            self._update_review_message_after_resolve(ctx.guild, app_data, member, "denied", reason=reason),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("Error finishing denial for %s in %s", member.id, ctx.guild.id, exc_info=result)
 
     @_applications.command(name="bypass")
     async def _bypass(self, ctx: commands.Context, *members: discord.Member):
@@ -4479,18 +4866,20 @@ class Applications(commands.Cog):
 
         now_iso = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
         results = []
+        await self.get_applications(ctx.guild)  # Load the status index used below
 
         for member in members:
             guild_id = ctx.guild.id
             user_id = member.id
 
-            async with self.config.guild(ctx.guild).applications() as apps:
-                existing = apps.get(str(user_id), {})
-                if isinstance(existing, dict) and existing.get("status") == "approved":
-                    results.append(f"⚠️ {member.mention} — already approved, skipped.")
-                    continue
+            if self._application_status(guild_id, user_id) is AppStatus.APPROVED:
+                results.append(f"⚠️ {member.mention} — already approved, skipped.")
+                continue
 
-                apps[str(user_id)] = {
+            await self._save_application(
+                ctx.guild,
+                user_id,
+                {
                     "status": "approved",
                     "submitted_at": now_iso,
                     "approved_at": now_iso,
@@ -4499,7 +4888,8 @@ class Applications(commands.Cog):
                     "review_message_id": None,
                     "interview_channel_id": None,
                     "bypassed": True,
-                }
+                },
+            )
 
             # Cancel any pending kick timer for this user
             if guild_id in self.timer_tasks and user_id in self.timer_tasks[guild_id]:
@@ -4513,10 +4903,10 @@ class Applications(commands.Cog):
             warning = await self._apply_approval_roles(ctx.guild, member)
 
             await self.log_application_event(
-                ctx.guild, member, "approved", decision_maker=ctx.guild.get_member(ctx.author.id)
+                ctx.guild, member, "approved", decision_maker=ctx.author
             )
 
-            if await self.config.guild(ctx.guild).approval_send_dm():
+            if (await self._get_settings(ctx.guild))["approval_send_dm"]:
                 await self._send_approval_dm(ctx.guild, member)
 
             if warning:
@@ -4530,134 +4920,112 @@ class Applications(commands.Cog):
         self, interaction: discord.Interaction, member: discord.Member
     ):
         """Approve application from button interaction."""
-        # Acknowledge within Discord's 3s window, then do heavier work.
-        if not interaction.response.is_done():
-            await interaction.response.defer(ephemeral=True)
-
-        applications = await self.config.guild(interaction.guild).applications()
-        if str(member.id) not in applications:
-            await interaction.followup.send(
-                f"❌ {member.mention} does not have an active application.", ephemeral=True
-            )
-            return
-
-        app_data = applications[str(member.id)]
-        if app_data.get("status") != "pending":
-            await interaction.followup.send(
-                f"❌ This application is already {app_data.get('status')}.", ephemeral=True
-            )
-            return
-
-        # Handle role changes on approval
-        await self._apply_approval_roles(interaction.guild, member)
 
-        # Update status
-        app_data["status"] = "approved"
-        app_data["approved_by"] = interaction.user.id
-        app_data["approved_at"] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-        
-        # Schedule cleanup
-        cleanup_delay = await self.config.guild(interaction.guild).cleanup_delay()
-        cleanup_time = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=cleanup_delay)
-        app_data["cleanup_scheduled_at"] = cleanup_time.isoformat()
-        
-        async with self.config.guild(interaction.guild).applications() as apps:
-            if str(member.id) in apps:
-                apps[str(member.id)].update(app_data)
-
-        # Log to log channel
-        decision_maker = interaction.guild.get_member(interaction.user.id)
-        await self.log_application_event(
-            interaction.guild, member, "approved", decision_maker=decision_maker
-        )
-
-        if await self.config.guild(interaction.guild).approval_send_dm():
-            await self._send_approval_dm(interaction.guild, member)
+        async def send_dm():
+            if (await self._get_settings(interaction.guild))["approval_send_dm"]:
+                await self._send_approval_dm(interaction.guild, member)
 
-        # Send confirmation (interaction already deferred)
-        await interaction.followup.send(
-            f"✅ Approved {member.mention}'s application.", ephemeral=True
+        await self._finalize_decision(
+            interaction,
+            member,
+            "approved",
+            f"✅ Approved {member.mention}'s application.",
+            role_mutation=self._apply_approval_roles,
+            followup=send_dm,
         )
 
-        # Update review channel message (new flow)
-        await self._update_review_message_after_resolve(interaction.guild, app_data, member, "approved")
-
-        log.info(f"Application approved for {member.display_name} by {interaction.user.display_name}")
-
     async def deny_application(
         self, interaction: discord.Interaction, member: discord.Member, reason: str
     ):
         """Deny application from modal interaction."""
-        applications = await self.config.guild(interaction.guild).applications()
-        if str(member.id) not in applications:
-            await interaction.response.send_message(
-                f"❌ {member.mention} does not have an active application.", ephemeral=True
-            )
-            return
 
-        app_data = applications[str(member.id)]
-        if app_data.get("status") != "pending":
-            await interaction.response.send_message(
-                f"❌ This application is already {app_data.get('status')}.", ephemeral=True
+        async def run_denial_action():
+            # Execute configured denial action (DM before removal)
+            settings = await self._get_settings(interaction.guild)
+            denial_action = self._normalize_member_action(settings["denial_action"], allow_none=True)
+            await self._execute_member_action(
+                interaction.guild,
+                member,
+                denial_action,
+                f"Application denied.{f' Reason: {reason}' if reason else ''}",
+                settings["denial_send_dm"],
+                tempban_seconds=settings["denial_tempban_duration_seconds"] if denial_action == "tempban" else None,
+                context="denial",
             )
-            return
 
-        # Respond to the modal within Discord's 3s limit, then do the rest via followup
-        await interaction.response.defer(ephemeral=True)
-
-        # Update status
-        app_data["status"] = "denied"
-        app_data["denied_by"] = interaction.user.id
-        app_data["denied_at"] = datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
-        app_data["denial_reason"] = reason
-        
-        # Schedule cleanup
-        cleanup_delay = await self.config.guild(interaction.guild).cleanup_delay()
-        cleanup_time = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=cleanup_delay)
-        app_data["cleanup_scheduled_at"] = cleanup_time.isoformat()
-        
-        async with self.config.guild(interaction.guild).applications() as apps:
-            if str(member.id) in apps:
-                apps[str(member.id)].update(app_data)
-
-        # Log to log channel
-        decision_maker = interaction.guild.get_member(interaction.user.id)
-        await self.log_application_event(
-            interaction.guild, member, "denied", decision_maker=decision_maker, reason=reason
-        )
-
-        # Execute configured denial action (DM before removal)
-        denial_action = self._normalize_member_action(
-            await self.config.guild(interaction.guild).denial_action(), allow_none=True
-        )
-        denial_send_dm = await self.config.guild(interaction.guild).denial_send_dm()
-        denial_tempban_seconds = (
-            await self.config.guild(interaction.guild).denial_tempban_duration_seconds()
-            if denial_action == "tempban"
-            else None
-        )
-        action_reason = f"Application denied.{f' Reason: {reason}' if reason else ''}"
-        await self._execute_member_action(
-            interaction.guild,
+        await self._finalize_decision(
+            interaction,
             member,
-            denial_action,
-            action_reason,
-            denial_send_dm,
-            tempban_seconds=denial_tempban_seconds,
-            context="denial",
+            "denied",
+            f"✅ Application denied. {member.mention} has been notified.",
+            reason=reason,
+            followup=run_denial_action,
         )
 
-        # Send confirmation (interaction already deferred)
-        await interaction.followup.send(
-            f"✅ Application denied. {member.mention} has been notified.", ephemeral=True
-        )
+    async def _finalize_decision(
+        self,
+        interaction: discord.Interaction,
+        member: discord.Member,
+        decision: str,
+        confirmation: str,
+        *,
+        reason: Optional[str] = None,
+        role_mutation: Optional[Callable[[discord.Guild, discord.Member], Awaitable]] = None,
+        followup: Optional[Callable[[], Awaitable]] = None,
+    ):
+        """Resolve a pending application as "approved" or "denied" from a review interaction.
 
-        # Update review channel message (new flow): remove buttons, show denied
-        await self._update_review_message_after_resolve(
-            interaction.guild, app_data, member, "denied", reason=reason
-        )
+        role_mutation runs under the decision lock before the record is saved; followup runs
+        alongside the log post, confirmation and review message edit once it is saved.
+        """
+        guild = interaction.guild
+        # Acknowledge within Discord's 3s window, then do heavier work and reply via followup
+        await interaction.response.defer(ephemeral=True)
+
+        # Check and mutate under the application's decision lock so concurrent clicks resolve only once
+        async with self._decision_lock(guild.id, member.id):
+            app_data = await self.get_application(guild, member.id)
+            if app_data is None:
+                await interaction.followup.send(
+                    f"❌ {member.mention} does not have an active application.", ephemeral=True
+                )
+                return
 
-        log.info(f"Application denied for {member.display_name} by {interaction.user.display_name}")
+            app_data = dict(app_data)  # Cached record is shared; edit a copy until it is saved
+            if self._application_status(guild.id, member.id) is not AppStatus.PENDING:
+                await interaction.followup.send(
+                    f"❌ This application is already {app_data.get('status')}.", ephemeral=True
+                )
+                return
+
+            if role_mutation is not None:
+                await role_mutation(guild, member)
+
+            # Update status and schedule cleanup from one timestamp
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            cleanup_at = now + await self._cleanup_delta(guild)
+            app_data["status"] = decision
+            app_data[f"{decision}_by"] = interaction.user.id
+            app_data[f"{decision}_at"] = now.isoformat()
+            if decision == "denied":
+                app_data["denial_reason"] = reason
+            app_data["cleanup_scheduled_at"] = cleanup_at.isoformat()
+
+            await self._update_application(guild, member.id, app_data)
+
+        # The decision is saved; the log post, confirmation, review edit and followup hit different endpoints
+        pending = [
+            self.log_application_event(guild, member, decision, decision_maker=interaction.user, reason=reason),
+            interaction.followup.send(confirmation, ephemeral=True),
+            self._update_review_message_after_resolve(guild, app_data, member, decision, reason=reason),
+        ]
+        if followup is not None:
+            pending.append(followup())
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                log.error("Error finishing %s decision for %s in %s", decision, member.id, guild.id, exc_info=result)
+
+        log.info(f"Application {decision} for {member.display_name} by {interaction.user.display_name}")
 
     @_applications.command(name="view")
     async def _view(self, ctx: commands.Context, member: discord.Member):
@@ -4665,12 +5033,11 @@ class Applications(commands.Cog):
 
         Usage: `[p]applications view @member`
         """
-        applications = await self.config.guild(ctx.guild).applications()
-        if str(member.id) not in applications:
+        app_data = await self.get_application(ctx.guild, member.id)
+        if app_data is None:
             await ctx.send(f"{member.mention} does not have an active application.")
             return
 
-        app_data = applications[str(member.id)]
         responses = app_data.get("responses", {})
         
         # Handle case where application hasn't been submitted yet
@@ -4695,26 +5062,22 @@ class Applications(commands.Cog):
 
         No options.
         """
-        applications = await self.config.guild(ctx.guild).applications()
-        pending = {
-            uid: app
-            for uid, app in applications.items()
-            if app.get("status") == "pending"
-        }
+        await self.get_applications(ctx.guild)
+        pending_ids = self._pending_ids[ctx.guild.id]
 
-        if not pending:
+        if not pending_ids:
             await ctx.send("No pending applications.")
             return
 
         embed = discord.Embed(
             title="Pending Applications",
-            color=await ctx.embed_color(),
+            color=await self._embed_color(ctx.channel),
         )
 
-        review_channel_id = await self.config.guild(ctx.guild).review_channel_id()
+        review_channel_id = (await self._get_settings(ctx.guild))["review_channel_id"]
         review_channel = ctx.guild.get_channel(review_channel_id) if review_channel_id else None
-        for user_id, app_data in list(pending.items())[:10]:  # Limit to 10
-            member = ctx.guild.get_member(int(user_id))
+        for user_id in pending_ids[:10]:  # Limit to 10
+            member = ctx.guild.get_member(user_id)
             if member:
                 loc = f"**Location:** {review_channel.mention}" if review_channel else "**Location:** Review channel"
                 embed.add_field(
@@ -4723,8 +5086,8 @@ class Applications(commands.Cog):
                     inline=True,
                 )
 
-        if len(pending) > 10:
-            embed.set_footer(text=f"Showing 10 of {len(pending)} pending applications")
+        if len(pending_ids) > 10:
+            embed.set_footer(text=f"Showing 10 of {len(pending_ids)} pending applications")
 
         await ctx.send(embed=embed)
 
@@ -4736,44 +5099,20 @@ class Applications(commands.Cog):
         it will close that applicant's application.
         Usage: `[p]applications close [@member]`
         """
-        # If no member specified, try to find from current channel
-        if member is None:
-            applications = await self.config.guild(ctx.guild).applications()
-            current_channel_id = ctx.channel.id
-
-            # Find application by interview channel ID
-            found_member = None
-            for user_id, app_data in applications.items():
-                if app_data.get("interview_channel_id") == current_channel_id:
-                    found_member = ctx.guild.get_member(int(user_id))
-                    if found_member:
-                        member = found_member
-                        break
-
-            if not member:
-                await ctx.send(
-                    "❌ No member specified and this doesn't appear to be an interview channel. "
-                    "Please specify a member: `[p]applications close @user`"
-                )
-                return
-
-        applications = await self.config.guild(ctx.guild).applications()
-        if str(member.id) not in applications:
-            await ctx.send(f"{member.mention} does not have an active application.")
+        member, app_data = await self._resolve_application(ctx, member, "close @user")
+        if app_data is None:
             return
 
-        app_data = applications[str(member.id)]
+        settings = await self._get_settings(ctx.guild)
         submitted = app_data.get("submitted_at") or app_data.get("responses")
         # Skip early_close action for users who were already approved (e.g. approved without submitting).
         run_early_close = not submitted and app_data.get("status") != "approved"
         if run_early_close:
             # Early close: user has not submitted. Execute configured action (DM before removal).
-            early_action = self._normalize_member_action(await self.config.guild(ctx.guild).early_close_action())
-            early_send_dm = await self.config.guild(ctx.guild).early_close_send_dm()
+            early_action = self._normalize_member_action(settings["early_close_action"])
+            early_send_dm = settings["early_close_send_dm"]
             early_tempban_seconds = (
-                await self.config.guild(ctx.guild).early_close_tempban_duration_seconds()
-                if early_action == "tempban"
-                else None
+                settings["early_close_tempban_duration_seconds"] if early_action == "tempban" else None
             )
             action_reason = "Application closed before submission."
             # Re-fetch member in case they left
@@ -4791,20 +5130,19 @@ class Applications(commands.Cog):
                 ctx.guild,
                 member,
                 "early_closed",
-                decision_maker=ctx.guild.get_member(ctx.author.id),
+                decision_maker=ctx.author,
             )
 
         review_message_id = app_data.get("review_message_id")
-        review_channel_id = await self.config.guild(ctx.guild).review_channel_id()
+        review_channel_id = settings["review_channel_id"]
         if review_channel_id and review_message_id:
             ch = ctx.guild.get_channel(review_channel_id)
             if ch:
                 try:
-                    msg = await ch.fetch_message(review_message_id)
-                    await msg.delete()
+                    await ch.get_partial_message(review_message_id).delete()
                 except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                     pass
-        if await self.config.guild(ctx.guild).delete_interview_on_resolve():
+        if settings["delete_interview_on_resolve"]:
             interview_channel_id = app_data.get("interview_channel_id")
             if interview_channel_id:
                 ich = ctx.guild.get_channel(interview_channel_id)
@@ -4816,9 +5154,7 @@ class Applications(commands.Cog):
         await ctx.send(f"✅ Closed application for {member.mention}.")
 
         # Remove from applications
-        async with self.config.guild(ctx.guild).applications() as apps:
-            if str(member.id) in apps:
-                del apps[str(member.id)]
+        await self._delete_application(ctx.guild, member.id)
 
     @_maintenance.command(name="clearorphaned")
     async def _clear_orphaned(self, ctx: commands.Context):
@@ -4826,13 +5162,12 @@ class Applications(commands.Cog):
 
         No options.
         """
-        applications = await self.config.guild(ctx.guild).applications()
-        review_channel_id = await self.config.guild(ctx.guild).review_channel_id()
+        applications = await self.get_applications(ctx.guild)
+        review_channel_id = (await self._get_settings(ctx.guild))["review_channel_id"]
         review_channel = ctx.guild.get_channel(review_channel_id) if review_channel_id else None
         to_remove = set()
-        for user_id, app_data in applications.items():
-            if app_data.get("status") != "pending":
-                continue
+        for user_id in self._pending_ids[ctx.guild.id]:
+            app_data = applications[user_id]
             review_message_id = app_data.get("review_message_id")
             if review_channel and review_message_id:
                 try:
@@ -4849,12 +5184,12 @@ class Applications(commands.Cog):
             await ctx.send("No orphaned application entries found.")
             return
 
-        async with self.config.guild(ctx.guild).applications() as apps:
-            for user_id in sorted(to_remove):
-                if user_id in apps:
-                    del apps[user_id]
+        for user_id in sorted(to_remove):
+            await self._delete_application(ctx.guild, user_id)
 
-        await ctx.send(f"Removed {len(to_remove)} orphaned application entry(ies): user IDs `{', '.join(sorted(to_remove))}`.")
+        await ctx.send(
+            f"Removed {len(to_remove)} orphaned application entry(ies): user IDs `{', '.join(map(str, sorted(to_remove)))}`."
+        )
 
     @_maintenance.command(name="removeuser")
     async def _remove_user(self, ctx: commands.Context, user_id: int):
@@ -4862,24 +5197,22 @@ class Applications(commands.Cog):
 
         Usage: `[p]applications maintenance removeuser <user_id>`
         """
-        applications = await self.config.guild(ctx.guild).applications()
-        user_id_str = str(user_id)
-        if user_id_str not in applications:
+        app_data = await self.get_application(ctx.guild, user_id)
+        if app_data is None:
             await ctx.send(f"No application found for user ID `{user_id}`.")
             return
 
-        app_data = applications[user_id_str]
-        review_channel_id = await self.config.guild(ctx.guild).review_channel_id()
+        settings = await self._get_settings(ctx.guild)
+        review_channel_id = settings["review_channel_id"]
         review_message_id = app_data.get("review_message_id")
         if review_channel_id and review_message_id:
             ch = ctx.guild.get_channel(review_channel_id)
             if ch:
                 try:
-                    msg = await ch.fetch_message(review_message_id)
-                    await msg.delete()
+                    await ch.get_partial_message(review_message_id).delete()
                 except (discord.NotFound, discord.Forbidden, discord.HTTPException):
                     pass
-        if await self.config.guild(ctx.guild).delete_interview_on_resolve():
+        if settings["delete_interview_on_resolve"]:
             interview_channel_id = app_data.get("interview_channel_id")
             if interview_channel_id:
                 ich = ctx.guild.get_channel(interview_channel_id)
@@ -4889,83 +5222,76 @@ class Applications(commands.Cog):
                     except (discord.Forbidden, discord.HTTPException):
                         pass
 
-        async with self.config.guild(ctx.guild).applications() as apps:
-            if user_id_str in apps:
-                del apps[user_id_str]
+        await self._delete_application(ctx.guild, user_id)
         await ctx.send(f"Removed application record for user ID `{user_id}`.")
 
     async def cleanup_loop(self):
         """Background task to periodically clean up expired application artifacts."""
         await self.bot.wait_until_ready()
 
+        min_sleep = 0.0
         while True:
             try:
-                # Wait 1 hour before checking again
-                await asyncio.sleep(3600)
+                # Sleep until the next cleanup or unban is due, or sweep at once if one already is.
+                # Something scheduled earlier than the planned wake-up interrupts the sleep to re-plan.
+                self._cleanup_wakeup.clear()
+                delay = max(min_sleep, self._seconds_until_next_cleanup())
+                if delay > 0:
+                    self._cleanup_deadline = time.time() + delay
+                    try:
+                        await asyncio.wait_for(self._cleanup_wakeup.wait(), timeout=delay)
+                        min_sleep = 0.0
+                        continue
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        self._cleanup_deadline = 0.0
+                # If a due item keeps failing, wait a little before sweeping again rather than spinning
+                min_sleep = _CLEANUP_MIN_SLEEP
 
                 log.debug("Running application cleanup check")
 
                 for guild in self.bot.guilds:
                     try:
-                        if not await self.config.guild(guild).enabled():
+                        # One cached settings snapshot per guild instead of a Config read per key
+                        settings = await self._get_settings(guild)
+                        if not settings["enabled"]:
                             continue
 
-                        applications = await self.config.guild(guild).applications()
-                        current_time = datetime.now(timezone.utc).replace(tzinfo=None)
-
-                        to_remove = []
-
-                        for user_id, app_data in applications.items():
-                            cleanup_time_str = app_data.get("cleanup_scheduled_at")
-                            if not cleanup_time_str:
-                                continue
-
-                            try:
-                                cleanup_time = datetime.fromisoformat(cleanup_time_str)
-                                if cleanup_time.tzinfo is not None:
-                                    cleanup_time = cleanup_time.replace(tzinfo=None)
-                                if current_time >= cleanup_time:
-                                    review_message_id = app_data.get("review_message_id")
-                                    review_channel_id = await self.config.guild(guild).review_channel_id()
-                                    if review_channel_id and review_message_id:
-                                        ch = guild.get_channel(review_channel_id)
-                                        if ch:
-                                            try:
-                                                msg = await ch.fetch_message(review_message_id)
-                                                await msg.delete()
-                                            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                                                pass
-                                    if await self.config.guild(guild).delete_interview_on_resolve():
-                                        interview_channel_id = app_data.get("interview_channel_id")
-                                        if interview_channel_id:
-                                            ich = guild.get_channel(interview_channel_id)
-                                            if ich:
-                                                try:
-                                                    await ich.delete(reason="Application cleanup")
-                                                except (discord.Forbidden, discord.HTTPException):
-                                                    pass
-                                    to_remove.append(user_id)
-                            except (ValueError, TypeError) as e:
-                                log.warning(f"Invalid cleanup_scheduled_at for user {user_id}: {e}")
-                                continue
+                        delete_interviews = settings["delete_interview_on_resolve"]
+                        applications = await self.get_applications(guild)
+                        current_time = time.time()
+
+                        # Due times come pre-parsed from the cache index; no awaits until the list is built
+                        to_remove = self._due_cleanups(guild.id, current_time)
+                        review_message_ids, interview_channels = self._cleanup_artifacts(
+                            guild, applications, to_remove, delete_interviews
+                        )
+
+                        if review_message_ids:
+                            review_channel_id = settings["review_channel_id"]
+                            ch = guild.get_channel(review_channel_id) if review_channel_id else None
+                            if ch:
+                                await self._delete_review_messages(ch, review_message_ids)
+                        if interview_channels:
+                            await self._delete_interview_channels(interview_channels, "Application cleanup")
 
                         # Remove cleaned up applications
                         if to_remove:
-                            async with self.config.guild(guild).applications() as apps:
-                                for user_id in to_remove:
-                                    if user_id in apps:
-                                        del apps[user_id]
+                            # One record at a time; a whole-dict rewrite would clobber concurrent set_raw writes
+                            for user_id in to_remove:
+                                await self._delete_application(guild, user_id)
                             log.info(f"Removed {len(to_remove)} cleaned up applications from {guild.name}")
 
                         # Process pending tempban unbans
-                        pending_unbans = await self.config.guild(guild).pending_unbans()
+                        pending_unbans = settings["pending_unbans"] or []
                         to_unban = [
                             entry
                             for entry in pending_unbans
-                            if datetime.fromisoformat(entry["unban_at"]) <= current_time
+                            if (unban_at := _parse_timestamp(entry.get("unban_at"))) is not None and unban_at <= current_time
                         ]
                         if to_unban:
-                            async with self.config.guild(guild).pending_unbans() as pending:
+                            async with self._edit_setting(guild, "pending_unbans") as pending:
                                 for entry in to_unban:
                                     uid = entry["user_id"]
                                     try:
@@ -4993,60 +5319,122 @@ class Applications(commands.Cog):
 
     async def cleanup_channels(self, guild: discord.Guild) -> int:
         """Manually trigger cleanup of expired application artifacts. Returns number cleaned."""
-        if not await self.config.guild(guild).enabled():
+        settings = await self._get_settings(guild)
+        if not settings["enabled"]:
             return 0
 
-        applications = await self.config.guild(guild).applications()
-        current_time = datetime.now(timezone.utc).replace(tzinfo=None)
+        delete_interviews = settings["delete_interview_on_resolve"]
+        applications = await self.get_applications(guild)
+        current_time = time.time()
         cleaned = 0
 
-        to_remove = []
-
-        for user_id, app_data in applications.items():
-            cleanup_time_str = app_data.get("cleanup_scheduled_at")
-            if not cleanup_time_str:
-                continue
+        # Due times come pre-parsed from the cache index; no awaits until the list is built
+        to_remove = self._due_cleanups(guild.id, current_time)
+        review_message_ids, interview_channels = self._cleanup_artifacts(
+            guild, applications, to_remove, delete_interviews
+        )
 
-            try:
-                cleanup_time = datetime.fromisoformat(cleanup_time_str)
-                if cleanup_time.tzinfo is not None:
-                    cleanup_time = cleanup_time.replace(tzinfo=None)
-                if current_time >= cleanup_time:
-                    review_message_id = app_data.get("review_message_id")
-                    review_channel_id = await self.config.guild(guild).review_channel_id()
-                    if review_channel_id and review_message_id:
-                        ch = guild.get_channel(review_channel_id)
-                        if ch:
-                            try:
-                                msg = await ch.fetch_message(review_message_id)
-                                await msg.delete()
-                                cleaned += 1
-                            except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                                pass
-                    if await self.config.guild(guild).delete_interview_on_resolve():
-                        interview_channel_id = app_data.get("interview_channel_id")
-                        if interview_channel_id:
-                            ich = guild.get_channel(interview_channel_id)
-                            if ich:
-                                try:
-                                    await ich.delete(reason="Manual application cleanup")
-                                    cleaned += 1
-                                except (discord.Forbidden, discord.HTTPException):
-                                    pass
-                    to_remove.append(user_id)
-            except (ValueError, TypeError) as e:
-                log.warning(f"Invalid cleanup_scheduled_at for user {user_id}: {e}")
-                continue
+        if review_message_ids:
+            review_channel_id = settings["review_channel_id"]
+            ch = guild.get_channel(review_channel_id) if review_channel_id else None
+            if ch:
+                cleaned += await self._delete_review_messages(ch, review_message_ids)
+        if interview_channels:
+            cleaned += await self._delete_interview_channels(interview_channels, "Manual application cleanup")
 
         # Remove cleaned up applications
         if to_remove:
-            async with self.config.guild(guild).applications() as apps:
-                for user_id in to_remove:
-                    if user_id in apps:
-                        del apps[user_id]
+            for user_id in to_remove:
+                await self._delete_application(guild, user_id)
 
         return cleaned
 
+    def _next_guild_cleanup(self, guild_id: int) -> Optional[float]:
+        """Earliest cached cleanup_scheduled_at or tempban expiry for an enabled guild, as epoch seconds."""
+        settings = self._guild_cache.get(guild_id)
+        if not settings or not settings.get("enabled"):
+            return None
+        due_times = [
+            due_time
+            for entry in settings.get("pending_unbans") or []
+            if (due_time := _parse_timestamp(entry.get("unban_at"))) is not None
+        ]
+        due_times.extend(self._cleanup_due.get(guild_id, {}).values())
+        return min(due_times) if due_times else None
+
+    def _seconds_until_next_cleanup(self) -> float:
+        """Seconds until the earliest cleanup or unban in any enabled guild; 0 if one is already due."""
+        due_times = [
+            due_time for guild_id in self._guild_cache if (due_time := self._next_guild_cleanup(guild_id)) is not None
+        ]
+        if not due_times:
+            return _CLEANUP_MAX_SLEEP
+        return min(_CLEANUP_MAX_SLEEP, max(0.0, min(due_times) - time.time()))
+
+    def _wake_cleanup_loop(self, due_time: float):
+        """Interrupt the cleanup loop's sleep if due_time comes before the deadline it is sleeping toward."""
+        if due_time < self._cleanup_deadline:
+            self._cleanup_wakeup.set()
+
+    def _due_cleanups(self, guild_id: int, now: float) -> List[int]:
+        """User IDs whose cached cleanup time has passed; call after get_applications()."""
+        return [user_id for user_id, due_time in self._cleanup_due.get(guild_id, {}).items() if due_time <= now]
+
+    @staticmethod
+    def _cleanup_artifacts(
+        guild: discord.Guild, applications: Dict[int, Dict], user_ids: List[int], delete_interviews: bool
+    ) -> Tuple[List[int], List[discord.abc.GuildChannel]]:
+        """Review message IDs and live interview channels belonging to the given applications."""
+        get_channel = guild.get_channel
+        review_message_ids = []
+        interview_channels = []
+        for user_id in user_ids:
+            app_data = applications[user_id]
+            if review_message_id := app_data.get("review_message_id"):
+                review_message_ids.append(review_message_id)
+            if delete_interviews and (channel_id := app_data.get("interview_channel_id")):
+                if channel := get_channel(channel_id):
+                    interview_channels.append(channel)
+        return review_message_ids, interview_channels
+
+    async def _delete_interview_channels(self, channels: List[discord.abc.GuildChannel], reason: str) -> int:
+        """Delete interview channels concurrently, at most _CLEANUP_CONCURRENCY at a time. Returns how many were deleted."""
+
+        async def delete(channel: discord.abc.GuildChannel) -> bool:
+            async with self._cleanup_sem:
+                try:
+                    await channel.delete(reason=reason)
+                    return True
+                except (discord.Forbidden, discord.HTTPException):
+                    return False
+
+        return sum(await asyncio.gather(*(delete(channel) for channel in channels)))
+
+    async def _delete_review_messages(self, channel: discord.TextChannel, message_ids: List[int]) -> int:
+        """Delete review messages 100 per request, falling back to one at a time. Returns how many were deleted."""
+        deleted = 0
+        bulk = True
+        for start in range(0, len(message_ids), 100):
+            batch = [discord.Object(id=message_id) for message_id in message_ids[start:start + 100]]
+            if bulk:
+                try:
+                    await channel.delete_messages(batch, reason="Application cleanup")
+                    deleted += len(batch)
+                    continue
+                except discord.Forbidden:
+                    # Bulk delete needs Manage Messages; the bot can still delete its own posts one by one
+                    bulk = False
+                except discord.HTTPException:
+                    # Rejected as a whole (e.g. a message is older than 14 days or already gone); retry singly
+                    pass
+            for obj in batch:
+                try:
+                    await channel.get_partial_message(obj.id).delete()
+                    deleted += 1
+                except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                    pass
+        return deleted
+
 
 async def setup(bot: Red):
     """Load the Applications cog."""